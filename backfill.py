@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+backfill.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  障害などで取りこぼした期間のレポートを、開始日〜終了日を指定して作り直す。
+  ・期間をセクションごとのチャンク（BACKFILL_CHUNK_DAYS 日ずつ）に分けて取得
+      自民党 / NISC / 金融庁 : 日付ページを 1 週間ずつ
+      デジタル庁             : 一覧を期間の始まりまで深掘り（1 チャンク）
+      ニュース               : 検索期間を 1 週間ずつ
+  ・セクション同士は並行、同じセクション（= 同じホスト）のチャンクは
+    BACKFILL_WORKERS 本までしか同時に走らせない
+  ・完了したチャンクは項目ストアに保存し、中断しても同じ期間で再実行すれば
+    未完了のチャンクだけを取り直す
+  ・一覧ページが現在分しか無いセクション（官邸・総務省・内閣府など）は対象外
+
+  各セクションは backfill(start, end) と BACKFILL_CHUNK_DAYS / BACKFILL_WORKERS を
+  定義すると対象になる（start / end は JST 0 時、両端を含む）。
+
+使い方:
+    python backfill.py --from 2025-04-01 --to 2025-06-30
+    python backfill.py --from 2025-04-01 --to 2025-06-30 --sources nisc,fsa -o q1.md
+    python backfill.py --from 2025-04-01 --to 2025-06-30 --restart   # 進捗を捨てて最初から
+"""
+
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+
+import browser
+import item_store
+import parsepool
+import scheduler
+from IT_monitoring import parse_date, parse_sources
+from item import CrossIndex, Item
+from item_store import open_store
+from report_writer import ReportWriter
+from watchers import ORDER, finish, load
+
+
+def supported():
+    """backfill() を持つセクション名（既定の順）"""
+    return [name for name in ORDER
+            if hasattr(load(name), "backfill")]
+
+
+def split(start, end, days):
+    """[start, end] を days 日ずつの (開始, 終了) に分ける。days=None なら分けない"""
+    if not days:
+        return [(start, end)]
+    out, s = [], start
+    while s <= end:
+        e = min(s + timedelta(days=days - 1), end)
+        out.append((s, e))
+        s = e + timedelta(days=1)
+    return out
+
+
+def chunk_id(start, end) -> str:
+    return f"{start:%Y-%m-%d}..{end:%Y-%m-%d}"
+
+
+def run_chunk(name, mod, start, end):
+    """1 チャンクを専用の Budget で実行する。取りこぼしがあれば完了扱いにしない"""
+    budget = scheduler.Budget(name=name)
+    items = scheduler.call(budget, mod.backfill, start, end)
+    if budget.truncated:
+        raise RuntimeError("incomplete chunk (host unavailable or fetch failed)")
+    return items
+
+
+def empty_section(mod, start, end) -> str:
+    return (f"{mod.TITLE}\n{start.month}月{start.day}日〜{end.month}月{end.day}日　"
+            "該当なし\n\n")
+
+
+def build_parser():
+    ap = argparse.ArgumentParser(description="指定期間のレポートを作り直す（中断しても再開可能）")
+    ap.add_argument("--from", dest="start", type=parse_date, required=True,
+                    help="開始日 YYYY-MM-DD")
+    ap.add_argument("--to", dest="end", type=parse_date, required=True,
+                    help="終了日 YYYY-MM-DD（この日を含む）")
+    ap.add_argument("--sources", type=parse_sources,
+                    help="対象セクションをカンマ区切りで指定（既定: 対応する全セクション）")
+    ap.add_argument("-o", "--output", default="backfill.md",
+                    help="Markdown の出力先（- で標準出力）")
+    ap.add_argument("--jsonl", help="JSON Lines の出力先")
+    ap.add_argument("--db", help="項目ストアの SQLite パス（進捗もここに保存）")
+    ap.add_argument("--restart", action="store_true",
+                    help="この期間の進捗を捨てて最初から取得")
+    return ap
+
+
+def main(argv=None):
+    ap = build_parser()
+    args = ap.parse_args(argv)
+    if args.start > args.end:
+        ap.error("--from must not be after --to")
+
+    names = supported()
+    if args.sources:
+        skipped = [n for n in args.sources if n not in names]
+        if skipped:
+            print(f"[WARN] backfill not supported: {', '.join(skipped)}", file=sys.stderr)
+        names = [n for n in args.sources if n in names]
+
+    # 過去分は新着判定と無関係なので、新着のみモードは使わない
+    item_store.configure(path=args.db, new_only=False)
+    store = open_store()
+    job = chunk_id(args.start, args.end)
+    if args.restart:
+        store.drop_job(job)
+
+    mods = {name: load(name) for name in names}
+    done = {name: {cid: [Item.load(name, d) for d in items]
+                   for cid, items in store.chunks_done(job, name).items()}
+            for name in names}
+    todo = {name: [c for c in split(args.start, args.end, mod.BACKFILL_CHUNK_DAYS)
+                   if chunk_id(*c) not in done[name]]
+            for name, mod in mods.items()}
+    for name in names:
+        print(f"[backfill] {name}: {len(done[name])} done, {len(todo[name])} to fetch",
+              file=sys.stderr)
+
+    # セクションごとに別のプールを持ち、同じホストへの同時接続数を抑える
+    pools = {name: ThreadPoolExecutor(max_workers=mods[name].BACKFILL_WORKERS,
+                                      thread_name_prefix=f"backfill-{name}")
+             for name in names if todo[name]}
+    failed = {name: 0 for name in names}
+    try:
+        futures = {pools[name].submit(run_chunk, name, mods[name], s, e): (name, chunk_id(s, e))
+                   for name in pools for s, e in todo[name]}
+        for fut in as_completed(futures):
+            name, cid = futures[fut]
+            try:
+                items = fut.result()
+            except Exception as exc:
+                failed[name] += 1
+                print(f"[WARN] {name} {cid}: {type(exc).__name__}: {exc}", file=sys.stderr)
+                continue
+            store.put_chunk(job, name, cid, [it.dump() for it in items])
+            done[name][cid] = items
+            print(f"[backfill] {name} {cid}: {len(items)} items", file=sys.stderr)
+    finally:
+        for pool in pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        browser.shutdown()
+        parsepool.shutdown()
+    import fetcher
+    print(fetcher.summary(), file=sys.stderr)
+
+    with ReportWriter(names, args.output, args.jsonl, index=CrossIndex(),
+                      titles={name: mod.TITLE for name, mod in mods.items()}) as writer:
+        for name in names:
+            mod = mods[name]
+            items = finish([it for cid in sorted(done[name]) for it in done[name][cid]],
+                           getattr(mod, "NEWEST_FIRST", False))
+            note = (f"※ {failed[name]} チャンクの取得に失敗したため途中までの結果です"
+                    "（同じ期間で再実行すると続きから取得します）\n\n") if failed[name] else ""
+
+            def md(items, mod=mod, note=note):
+                body = mod.render(items, args.end) if items else empty_section(mod, args.start, args.end)
+                return body + note
+            writer.submit(name, items, md, partial=bool(failed[name]))
+
+    if any(failed.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
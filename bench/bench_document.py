@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_document.py
+
+■ キーワード判定とページ解析の 1 件あたりの時間を、以前の書き方と比較する。
+  ・見出し判定: キーワードごとに NFKC（内閣府）/ NFKC + 1 文字ずつの半角化（デジタル庁）
+    → document.Matcher（正規化 1 回 + 正規表現 1 本）
+  ・ページ解析: get_text() を判定ごとに呼ぶ → document.Document（1 回だけ作って使い回す）
+
+使い方:
+    python bench/bench_document.py [繰り返し回数] > bench_output.txt
+"""
+
+import os
+import re
+import sys
+import time
+import unicodedata
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import jpdate
+from document import Document, Matcher
+from watchers.cao import KEYWORDS as CAO_KW
+from watchers.digital import RAW_KW as DIG_KW
+from watchers.fsa import KEYWORDS as FSA_KW
+
+SHORT = {"ai", "it", "dx"}
+half = lambda s: ''.join(chr(ord(c)-0xFEE0) if '０' <= c <= '９' else c for c in s)
+
+
+def old_cao(text):
+    t = unicodedata.normalize("NFKC", text).lower()
+    for kw in CAO_KW:
+        k = unicodedata.normalize("NFKC", kw).lower()
+        if k in SHORT:
+            if re.search(rf"(?:^|[^a-z0-9]){k}(?:[^a-z0-9]|$)", t):
+                return True
+        elif k in t:
+            return True
+    return False
+
+
+_dig_norm = [half(unicodedata.normalize("NFKC", k)).lower() for k in DIG_KW]
+
+def old_digital(text):
+    t = half(unicodedata.normalize("NFKC", text)).lower()
+    return any((re.search(rf"(?:^|[^a-z0-9]){k}(?:[^a-z0-9]|$)", t) if k in SHORT else k in t)
+               for k in _dig_norm)
+
+
+def old_fsa(html):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+    dt = (jpdate.find_date_soup(soup, ("era",), tz=None, fallback=False)
+          or jpdate.find_date(soup.get_text(), ("era",), tz=None))
+    tag = soup.find("title") or soup.find("h1") or soup.find("h2")
+    title = tag.get_text(strip=True) if tag else ""
+    return any(kw in soup.get_text() for kw in FSA_KW), title, dt
+
+
+FSA = Matcher(FSA_KW)
+
+def new_fsa(html):
+    doc = Document(html)
+    return doc.matches(FSA), doc.first("title", "h1", "h2"), doc.date(("era",), tz=None)
+
+
+def timeit(fn, args, n):
+    t0 = time.perf_counter()
+    for _ in range(n):
+        for a in args:
+            fn(a)
+    return (time.perf_counter() - t0) / (n * len(args))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    titles = [f"第{i}回 地域交通の再編に関する検討会（令和７年６月{i % 28 + 1}日開催）" for i in range(50)]
+    body = "".join(f"<p>第{j}段落。金融機関の監督指針の改正案を公表します。</p>" for j in range(300))
+    html = (f"<html><head><title>報道発表資料</title></head><body><h1>監督指針の改正</h1>"
+            f"<p>令和７年６月９日</p>{body}<p>人事異動</p></body></html>")
+
+    cao, dig = Matcher(CAO_KW), Matcher(DIG_KW)
+    assert [old_cao(t) for t in titles] == [cao.hit(t) for t in titles]
+    assert [old_digital(t) for t in titles] == [dig.hit(t) for t in titles]
+    assert old_fsa(html) == new_fsa(html)
+    # 大文字だけの略語は区別して当て、それ以外の短い英数字は区別しない
+    ldp = Matcher(["IT", "5g", "Ai"])
+    assert [ldp.hit(t) for t in ("5G基地局の整備", "5g基地局", "AI戦略", "IT政策", "it is", "ITS")] \
+        == [True, True, True, True, False, False]
+
+    rows = [
+        ("見出し判定（内閣府）", timeit(old_cao, titles, n), timeit(cao.hit, titles, n)),
+        ("見出し判定（デジタル庁）", timeit(old_digital, titles, n), timeit(dig.hit, titles, n)),
+        ("ページ解析（金融庁）", timeit(old_fsa, [html], max(1, n // 20)),
+         timeit(new_fsa, [html], max(1, n // 20))),
+    ]
+    print(f"# document benchmark  (repeat={n}, page={len(html.encode()) // 1024} KiB)\n")
+    print("| 処理 | 以前 (µs) | Document / Matcher (µs) | 倍率 |")
+    print("|---|---:|---:|---:|")
+    for name, old, new in rows:
+        print(f"| {name} | {old * 1e6:.1f} | {new * 1e6:.1f} | {old / new:.1f}x |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_jpdate.py
+
+■ 日付抽出 1 ページあたりの処理時間を、旧実装と jpdate で比較する。
+  ・総務省型: 文書全体を NFKC + half() してから正規表現 3 種（旧 parse_dt）
+  ・デジタル庁型: BeautifulSoup で組み立てて soup.text を走査（旧 article_date）
+  どちらも jpdate.find_date_html（局所領域 → 必要時のみ全体）と比べる。
+
+使い方:
+    python bench/bench_jpdate.py [繰り返し回数] > bench_output.txt
+"""
+
+import os
+import re
+import sys
+import timeit
+import unicodedata
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import jpdate
+
+JST = timezone(timedelta(hours=9))
+
+# ───────── 旧実装（watchers/soumu.py, watchers/digital.py から移植）
+half   = lambda s: ''.join(chr(ord(c)-0xFEE0) if '０' <= c <= '９' else c for c in s)
+jp_re  = re.compile(r"令和(\d+)年(\d{1,2})月(\d{1,2})日")
+ymd_re = re.compile(r"(\d{4})年(\d{1,2})月(\d{1,2})日")
+slash  = re.compile(r"(\d{4})/(\d{1,2})/(\d{1,2})")
+
+def old_parse_dt(text):
+    t = half(unicodedata.normalize("NFKC", text))
+    if m := jp_re.search(t):
+        return datetime(2018 + int(m[1]), int(m[2]), int(m[3]), tzinfo=JST)
+    if m := ymd_re.search(t):
+        return datetime(*map(int, m.groups()), tzinfo=JST)
+    if m := slash.search(t):
+        return datetime(*map(int, m.groups()), tzinfo=JST)
+
+def old_article_date(html):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+    if t := soup.find("time", datetime=True):
+        y, m, d = map(int, t["datetime"][:10].split("-"))
+        return datetime(y, m, d, tzinfo=JST)
+    if m := ymd_re.search(soup.text):
+        return datetime(*map(int, m.groups()), tzinfo=JST)
+
+# ───────── 疑似ページ（省庁サイト程度の大きさ・構成）
+def make_page(date_html: str, nav_links: int = 400, paras: int = 300) -> str:
+    nav = "".join(f'<li><a href="/menu/{i}.html">政策分野のご案内 第{i}項</a></li>'
+                  for i in range(nav_links))
+    body = "".join(f"<p>本文 第{i}段落。情報通信審議会の答申を踏まえ、"
+                   f"デジタル化の推進に関する取組を全角数字１２３４５で記載します。</p>"
+                   for i in range(paras))
+    return ("<html><head><title>報道資料</title>"
+            "<script>var cfg = {a: 1, b: '２０２０年'};</script></head><body>"
+            f"<ul class='nav'>{nav}</ul><main><h1>電気通信事業部会の開催について</h1>"
+            f"{date_html}{body}</main><footer>Copyright 総務省</footer></body></html>")
+
+PAGES = {
+    "令和・見出し直後":   make_page("<p>令和７年６月９日</p>"),
+    "西暦・見出し直後":   make_page("<p class='date'>２０２５年６月９日</p>"),
+    "<time datetime>":   make_page('<time datetime="2025-06-09">2025年6月9日</time>'),
+}
+
+
+def bench(fn, arg, n):
+    return min(timeit.repeat(lambda: fn(arg), number=n, repeat=3)) / n * 1e6
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"# jpdate benchmark  (n={n}, µs/page, best of 3)\n")
+    print("| ページ | 大きさ | 旧 parse_dt | 旧 article_date | jpdate.find_date_html | 削減 (対 parse_dt) |")
+    print("|---|---:|---:|---:|---:|---:|")
+    kinds = ("era", "ymd", "slash")
+    try:
+        import bs4  # noqa: F401
+        has_bs4 = True
+    except ImportError:
+        has_bs4 = False
+    for name, html in PAGES.items():
+        assert jpdate.find_date_html(html, kinds) == old_parse_dt(html), name
+        t_old = bench(old_parse_dt, html, n)
+        t_soup = bench(old_article_date, html, max(1, n // 10)) if has_bs4 else float("nan")
+        t_new = bench(lambda h: jpdate.find_date_html(h, kinds), html, n)
+        print(f"| {name} | {len(html)//1024} KiB | {t_old:,.0f} | {t_soup:,.0f} | "
+              f"{t_new:,.0f} | {t_old - t_new:,.0f} µs ({t_old / t_new:.0f}x) |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_memo.py
+
+■ 内容の変わらないページ 1 枚あたりの時間を、毎回解析する場合と
+  parsepool.run_memo（正規化ハッシュ + 項目ストアのメモ）で比べる。
+  ・ページは金融庁の人事異動ページ（jinji/index.html）に似せた合成 HTML
+  ・解析はその場で行う（IT_MONITOR_PARSE_WORKERS=0）
+
+使い方:
+    python bench/bench_memo.py [繰り返し回数] > bench_output.txt
+"""
+
+import os
+import sys
+import time
+
+os.environ["IT_MONITOR_PARSE_WORKERS"] = "0"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import item_store
+import parsepool
+from watchers.fsa import KEYWORDS, parse_jinji
+
+URL = "https://www.fsa.go.jp/common/about/jinji/index.html"
+
+
+def page() -> bytes:
+    rows = "".join(f"<li>令和7年{m}月{d}日発令　人事異動について（{m}月{d}日）</li>"
+                   for m in range(1, 13) for d in (1, 15))
+    body = "".join(f"<p>第{j}段落。金融機関の監督に関するお知らせ。</p>" for j in range(300))
+    return (f"<html><head><title>人事異動</title><script>var t={time.time()};</script></head>"
+            f"<body><h1>人事異動</h1><ul>{rows}</ul>{body}</body></html>").encode("utf-8")
+
+
+def timeit(fn, n):
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    item_store.configure(path=":memory:")
+    content = page()
+    miss = parsepool.run_memo("fsa", URL, KEYWORDS, parse_jinji, content, "utf-8")
+    hit  = parsepool.run_memo("fsa", URL, KEYWORDS, parse_jinji, page(), "utf-8")
+    assert miss and [list(r) for r in miss] == hit
+
+    full = timeit(lambda: parse_jinji(content, "utf-8"), n)
+    memo = timeit(lambda: parsepool.run_memo("fsa", URL, KEYWORDS, parse_jinji, content, "utf-8"), n)
+    print(f"# memo benchmark  (repeat={n}, page={len(content) // 1024} KiB)\n")
+    print("| 処理 | 毎回解析 (ms) | メモ (ms) | 倍率 |")
+    print("|---|---:|---:|---:|")
+    print(f"| 人事異動ページ（金融庁） | {full * 1e3:.2f} | {memo * 1e3:.2f} | {full / memo:.0f}x |")
+
+
+if __name__ == "__main__":
+    main()
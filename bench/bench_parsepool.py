@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_parsepool.py
+
+■ 取得済みページ N 枚の解析にかかる時間を比較する。
+  ・スレッド 4 本で BeautifulSoup 解析（現状の並行セクションに相当。GIL で実質直列）
+  ・parsepool（プロセスプール）へ投げて結果レコードだけ受け取る
+  ・parsepool.arun を asyncio.gather で待つ（asyncio 取得と組み合わせる場合）
+解析関数は watchers.nisc.parse_page（キーワード判定・見出し・日付抽出）。
+
+使い方:
+    python bench/bench_parsepool.py [ページ数] > bench_output.txt
+"""
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import parsepool
+from watchers.nisc import parse_page
+
+
+def make_page(i: int, paras: int = 300) -> bytes:
+    body = "".join(f"<p>本文 第{j}段落。サイバーセキュリティ対策の推進に関する取組を記載します。</p>"
+                   for j in range(paras))
+    return (f"<html><head><meta charset='utf-8'><title>お知らせ {i}</title></head><body>"
+            f"<h2>サイバーセキュリティ月間 第{i}回</h2><p>2025年6月9日</p>{body}"
+            "</body></html>").encode()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    pages = [make_page(i) for i in range(n)]
+    print(f"# parsepool benchmark  (pages={n}, {len(pages[0]) // 1024} KiB/page, "
+          f"workers={parsepool.WORKERS}, cpus={os.cpu_count()})\n")
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(4) as ex:
+        base = list(ex.map(lambda p: parse_page(p, None), pages))
+    t_thread = time.perf_counter() - t0
+
+    parsepool.run(parse_page, pages[0], None)          # 子プロセスの起動を計測から除く
+    t0 = time.perf_counter()
+    futs = [parsepool.submit(parse_page, p, None) for p in pages]
+    pooled = [f.result() for f in futs]
+    t_pool = time.perf_counter() - t0
+
+    async def gather():
+        return await asyncio.gather(*(parsepool.arun(parse_page, p, None) for p in pages))
+    t0 = time.perf_counter()
+    awaited = asyncio.run(gather())
+    t_async = time.perf_counter() - t0
+    parsepool.shutdown()
+
+    assert base == pooled == awaited
+    print("| 方式 | 合計 (s) | 1 ページ (ms) | 対スレッド |")
+    print("|---|---:|---:|---:|")
+    for name, t in (("スレッド 4 本", t_thread), ("parsepool.submit", t_pool),
+                    ("parsepool.arun + gather", t_async)):
+        print(f"| {name} | {t:.2f} | {t / n * 1000:.1f} | {t_thread / t:.1f}x |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+check_meti.py
+
+■ 同梱の watchers/fixtures/meti で経産省セクションを通信なしに動かし、
+  期待どおりの項目が出るかを確かめる（一致しなければ AssertionError）。
+  ・URL の日付・一覧の日付・詳細ページの日付のそれぞれで拾えること
+  ・キーワードに合わないもの・期間外のものは出ないこと
+  ・詳細ページが 404 のものは日付なしとして落ち、セクションは途中扱いにならないこと
+
+使い方:
+    python bench/check_meti.py
+"""
+
+import os
+import sys
+from datetime import datetime
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+os.environ["IT_MONITOR_METI_FIXTURES"] = os.path.join(ROOT, "watchers", "fixtures", "meti")
+os.environ["IT_MONITOR_PARSE_WORKERS"] = "0"
+sys.path.insert(0, ROOT)
+import item_store
+import scheduler
+from watchers import finish, meti
+
+EXPECTED = [
+    ("2025-06-06", "https://www.meti.go.jp/press/2025/06/20250606003/20250606003.html"),
+    ("2025-06-09", "https://www.meti.go.jp/press/2025/06/20250609001/20250609001.html"),
+    ("2025-06-10", "https://www.meti.go.jp/shingikai/sankoshin/shomu_ryutsu/joho_keizai/015.html"),
+    ("2025-06-11", "https://www.meti.go.jp/shingikai/mono_info_service/digital_jinzai/012.html"),
+]
+
+
+def main():
+    item_store.configure(path=":memory:", new_only=False)
+    budget = scheduler.Budget(name="meti")
+    items = finish(scheduler.call(budget, meti.collect, datetime(2025, 6, 10)))
+    got = [(f"{it.dt:%Y-%m-%d}", it.url) for it in items]
+    assert got == EXPECTED, got
+    assert not budget.truncated, "section marked partial"
+    print(f"[check] meti fixtures: {len(got)} item(s) OK")
+
+
+if __name__ == "__main__":
+    main()
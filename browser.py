@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+browser.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  playwright (Chromium) をプロセス内で 1 つだけ起動し、各セクションで共有する。
+  ・playwright の sync API は起動したスレッドからしか触れないので、専用スレッドが
+    ブラウザを持ち、各セクションは render(url) で描画後の HTML だけを受け取る
+  ・ブラウザは最初の render() で起動し、shutdown() まで閉じない
+    （常駐モードでは巡回のたびに Chromium を起動し直さない）
+  ・User-Agent ごとにコンテキストを保持し、ページは 1 回ごとに開いて閉じる
+  ・描画は専用スレッドで 1 本ずつ進む（同時に動くのは ldp / soumu 程度なので足りる）
+  ・描画後の HTML は snapshots に保存し、保存分の再現中はブラウザを起動しない
+
+playwright を読み込むのは専用スレッドの中だけなので、import 自体は軽い。
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+
+LAUNCH_ARGS = ["--disable-blink-features=AutomationControlled"]
+
+_jobs = None
+_thread = None
+_lock = threading.Lock()
+
+
+def _serve(jobs: queue.Queue):
+    try:
+        _loop(jobs)
+    except BaseException as e:
+        # playwright 自体が起動できないときは待っている描画をすべて失敗させる
+        while True:
+            try:
+                job = jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None and job[0].set_running_or_notify_cancel():
+                job[0].set_exception(e)
+
+
+def _loop(jobs: queue.Queue):
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = None
+        contexts = {}
+        while True:
+            job = jobs.get()
+            if job is None:
+                break
+            fut, url, wait_until, timeout_ms, user_agent = job
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                if browser is None or not browser.is_connected():
+                    browser = p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+                    contexts.clear()
+                if user_agent not in contexts:
+                    contexts[user_agent] = browser.new_context(user_agent=user_agent)
+                page = contexts[user_agent].new_page()
+                try:
+                    page.goto(url, wait_until=wait_until, timeout=timeout_ms)
+                    fut.set_result(page.content())
+                finally:
+                    page.close()
+            except BaseException as e:
+                fut.set_exception(e)
+        if browser is not None:
+            browser.close()
+
+
+def start() -> queue.Queue:
+    """専用スレッドを用意する（playwright が無ければ ImportError）。
+    fetcher.guard() の外で呼んでおけば、未導入がホストの不調と数えられない"""
+    import snapshots
+    if snapshots.replaying():
+        return None         # 保存分の再現中はブラウザを使わない
+    import playwright.sync_api  # noqa: F401
+
+    global _jobs, _thread
+    with _lock:
+        if _thread is None or not _thread.is_alive():
+            _jobs = queue.Queue()
+            _thread = threading.Thread(target=_serve, args=(_jobs,),
+                                       name="browser", daemon=True)
+            _thread.start()
+        return _jobs
+
+
+def render(url: str, wait_until: str = "networkidle", timeout_ms: int = 30000,
+           user_agent: str = None) -> str:
+    """url を開いて描画後の HTML を返す（goto の失敗はそのまま送出）"""
+    import snapshots
+    if snapshots.replaying():
+        return snapshots.replayed(url).text
+    fut = Future()
+    start().put((fut, url, wait_until, timeout_ms, user_agent))
+    # 前の描画を待つ時間も含めて、goto の締め切りより少し長く待つ
+    html = fut.result(timeout=timeout_ms / 1000 + 30)
+    snapshots.record(url, html, content_type="text/html; charset=utf-8")
+    return html
+
+
+def shutdown() -> None:
+    """ブラウザを閉じる（次の render() でまた起動する）"""
+    global _jobs, _thread
+    with _lock:
+        if _thread is not None:
+            _jobs.put(None)
+            _thread.join(timeout=10)
+        _jobs, _thread = None, None
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+daemon.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  常駐して各セクションをそれぞれの間隔で巡回し、新着だけをレポートに追記する。
+  ・ブラウザ (browser.py)、HTTP 接続 (fetcher の共有 Session)、解析プロセス (parsepool)、
+    各セクションのキーワード判定はプロセス内に残り、2 回目以降の巡回では作り直さない
+  ・間隔はセクションの POLL_SEC を初期値とし、新着があれば SPEED_UP 倍、
+    無ければ SLOW_DOWN 倍にする（POLL_MIN〜POLL_MAX）。更新の多い内閣府 RSS は短く、
+    動きの少ない NISC の日付ページは長くなる。学習した間隔は項目ストアに保存して
+    再起動後も引き継ぐ
+  ・取得に失敗した・途中までだったセクションは間隔を変えずに次の予定で取り直す
+  ・新着の判定は項目ストア（新着のみモード）で行い、新着のあったセクションだけを
+    時刻つきの見出しの下に -o のファイルへ追記する（JSON Lines も追記）
+  ・SIGTERM / Ctrl-C で巡回の切れ目に止まる
+
+使い方:
+    python daemon.py -o alerts.md --jsonl alerts.jsonl
+    python daemon.py --sources cao,nisc,news --poll cao=300
+    python daemon.py --once -o -           # 期限の来たセクションを 1 回だけ巡回
+"""
+
+import argparse
+import signal
+import sys
+import threading
+from datetime import datetime, timedelta
+
+import browser
+import fetcher
+import item_store
+import parsepool
+import scheduler
+import snapshots
+from IT_monitoring import (DEADLINE_SEC, failed_section, parse_budget, parse_sources,
+                           run_section, section_budget)
+from item import CrossIndex
+from item_store import open_store
+from report_writer import ReportWriter
+from watchers import JST, ORDER, jst_today, load
+
+POLL_DEFAULT = 3600         # POLL_SEC を持たないセクションの初期間隔（秒）
+POLL_MIN     = 300
+POLL_MAX     = 6 * 3600
+SPEED_UP     = 0.5          # 新着があったときの間隔の倍率
+SLOW_DOWN    = 1.5          # 新着が無かったときの倍率
+
+
+def adapt(interval: float, changed: bool) -> float:
+    """今回の結果から次の間隔を決める"""
+    interval *= SPEED_UP if changed else SLOW_DOWN
+    return max(POLL_MIN, min(POLL_MAX, interval))
+
+
+class Schedule:
+    """セクションごとの (間隔, 次回予定, 最後に新着があった時刻)"""
+
+    def __init__(self, names, overrides=None):
+        self.store = open_store()
+        self.state = {}
+        now = datetime.now(JST)
+        for name in names:
+            saved = self.store.poll_state(name)
+            if saved and name not in (overrides or {}):
+                self.state[name] = saved
+            else:
+                first = (overrides or {}).get(name) or getattr(load(name), "POLL_SEC", POLL_DEFAULT)
+                self.state[name] = (float(first), now, None)
+
+    def due(self, now: datetime):
+        return [name for name in ORDER
+                if name in self.state and self.state[name][1] <= now]
+
+    def wait_sec(self, now: datetime) -> float:
+        nxt = min(due for _, due, _ in self.state.values())
+        return max(0.0, (nxt - now).total_seconds())
+
+    def done(self, name: str, now: datetime, changed: bool, ok: bool) -> None:
+        interval, _, last = self.state[name]
+        if ok:
+            interval = adapt(interval, changed)
+        if changed:
+            last = now
+        nxt = now + timedelta(seconds=interval)
+        self.state[name] = (interval, nxt, last)
+        self.store.put_poll_state(name, interval, nxt, last)
+
+
+def run_cycle(names, args, budgets):
+    """names を 1 回巡回し {名前: (新着 Item のリスト, Markdown の関数 or 文字列, 成否)} を返す"""
+    today = jst_today()
+    results = {}
+
+    def on_done(name, result, exc, budget):
+        if exc is not None:
+            print(f"[WARN] {name}: {exc}", file=sys.stderr)
+            results[name] = ([], failed_section(name, exc), False)
+            return
+        items, md = result
+        if budget.truncated:
+            print(f"[WARN] {name}: partial result", file=sys.stderr)
+        results[name] = (items, md, not budget.truncated)
+
+    scheduler.run_all({name: (lambda name=name: run_section(name, today)) for name in names},
+                      deadline_sec=args.deadline or None,
+                      budgets={name: budgets.get(name) for name in names},
+                      on_done=on_done)
+    return results
+
+
+def write_changes(results, args, now: datetime) -> int:
+    """新着のあったセクションだけを追記し、書いたセクション数を返す"""
+    changed = [name for name in ORDER if name in results and results[name][0]]
+    if not changed:
+        return 0
+    titles = {name: load(name).TITLE for name in changed}
+    header = f"## {now:%Y-%m-%d %H:%M} 新着\n\n"
+    with ReportWriter(changed, args.output, args.jsonl, index=CrossIndex(),
+                      titles=titles, append=True, header=header) as writer:
+        for name in changed:
+            items, md, _ = results[name]
+            writer.submit(name, items, md)
+    return len(changed)
+
+
+def build_parser():
+    ap = argparse.ArgumentParser(description="常駐して新着だけをレポートに追記する")
+    ap.add_argument("-o", "--output", default="alerts.md",
+                    help="新着を追記する Markdown（- で標準出力）")
+    ap.add_argument("--jsonl", help="新着を追記する JSON Lines")
+    ap.add_argument("--sources", type=parse_sources, default=list(ORDER),
+                    help="巡回するセクションをカンマ区切りで指定")
+    ap.add_argument("--db", help="項目ストアの SQLite パス（巡回間隔もここに保存）")
+    ap.add_argument("--poll", type=parse_budget, action="append", default=[],
+                    metavar="NAME=SECONDS", help="巡回間隔の初期値を上書き（保存済みの間隔より優先）")
+    ap.add_argument("--deadline", type=float, default=DEADLINE_SEC,
+                    help=f"1 回の巡回の締め切り（秒、既定 {DEADLINE_SEC}）")
+    ap.add_argument("--once", action="store_true",
+                    help="期限の来たセクションを 1 回だけ巡回して終了")
+    return ap
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    item_store.configure(path=args.db, new_only=True)
+    store = open_store()
+    schedule = Schedule(args.sources, dict(args.poll))
+    budgets = {name: section_budget(name) for name in args.sources}
+
+    stop = threading.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, lambda *_: stop.set())
+
+    try:
+        while not stop.is_set():
+            now = datetime.now(JST)
+            due = schedule.due(now)
+            if not due:
+                if args.once:
+                    break
+                stop.wait(schedule.wait_sec(now))
+                continue
+
+            store.new_run()
+            fetcher.new_run()       # 応答の使い回しは巡回 1 回の中だけ
+            results = run_cycle(due, args, budgets)
+            written = write_changes(results, args, now)
+            for name in due:
+                items, _, ok = results.get(name, ([], None, False))
+                schedule.done(name, datetime.now(JST), bool(items), ok)
+            print(f"[daemon] {now:%H:%M:%S} polled {','.join(due)}; "
+                  f"{written} section(s) with new items", file=sys.stderr)
+            print(fetcher.summary(), file=sys.stderr)
+            snapshots.prune()
+            if args.once:
+                break
+    finally:
+        browser.shutdown()
+        parsepool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+document.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  取得したページ 1 枚を表す Document と、キーワード判定の Matcher。
+  ・HTML の解析、表示テキスト、NFKC + 小文字化したテキスト、<title> と見出しは
+    最初に使われたときに 1 回だけ作り、キーワード・日付・タイトルの各抽出で使い回す
+  ・Matcher はキーワードを作成時に 1 回だけ正規化して正規表現にまとめる。
+    判定は正規化済みテキストへの検索で済む
+  ・2 文字以下の英数字は単語境界つき。そのうち大文字だけの略語（IT / AI / DX など）は
+    小文字化しない NFKC のテキストに大文字・小文字を区別して当てる（英文の "it" を
+    拾わないため）。5G などそれ以外は大文字・小文字を区別しない
+  ・NFKC は全角英数字を半角にするので、別途の全角→半角変換はしない
+  ・本文のような長いテキストは、非 ASCII の連続部分のうち正規形でないものにだけ
+    NFKC をかける（和文のページでは全体にかけるより数倍速く、結果は同じ）
+
+  Document(content, encoding) : 生のバイト列（または str）から。bs4 は使うときに読み込む
+  Matcher(keywords)           : m.hit(text) / doc.matches(m)
+  nfkc(text)                  : NFKC のみ（大文字・小文字はそのまま）
+  normalize(text)             : NFKC + 小文字化
+  fingerprint(content)        : script / style / コメント・空白の違いを無視した本文のハッシュ
+"""
+
+import hashlib
+import re
+import unicodedata
+from functools import cached_property
+
+import jpdate
+
+PIECEWISE_MIN = 512     # これより短い文字列（見出しなど）は丸ごと NFKC にかける
+
+_SPACE  = re.compile(r"\s+")
+_HIDDEN = re.compile(r"<(script|style|noscript|template)\b.*?</\1\s*>", re.S | re.I)
+# 直前の 1 文字も含めるのは、ASCII の後ろに結合文字が続く場合（e + ́ → é）のため
+_NON_ASCII = re.compile(r"[\x00-\x7f]?[^\x00-\x7f]+")
+# 毎回変わりがちな部分（埋め込みのトークン・時刻・広告の script など）
+_VOLATILE = re.compile(rb"<(script|style|noscript|template)\b.*?</\1\s*>|<!--.*?-->", re.S | re.I)
+_SPACE_B  = re.compile(rb"\s+")
+
+
+def _nfkc_piece(m) -> str:
+    s = m.group()
+    return s if unicodedata.is_normalized("NFKC", s) else unicodedata.normalize("NFKC", s)
+
+
+def nfkc(text: str) -> str:
+    """NFKC（全角英数字・記号もここで半角になる）。大文字・小文字はそのまま"""
+    text = text or ""
+    if len(text) < PIECEWISE_MIN:
+        return unicodedata.normalize("NFKC", text)
+    if text.isascii() or unicodedata.is_normalized("NFKC", text):
+        return text
+    return _NON_ASCII.sub(_nfkc_piece, text)
+
+
+def normalize(text: str) -> str:
+    """NFKC + 小文字化"""
+    return nfkc(text).lower()
+
+
+def fingerprint(content) -> str:
+    """本文の正規化ハッシュ。表示と解析に関係しない違いでは変わらない"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(_SPACE_B.sub(b" ", _VOLATILE.sub(b"", content))).hexdigest()
+
+
+def _short_ascii(word: str) -> bool:
+    return len(word) <= 2 and word.isascii()
+
+
+def _acronym(word: str) -> bool:
+    """大文字・小文字を区別して当てる略語か（AI / IT / DX。5G や Ai は含めない）"""
+    return _short_ascii(word) and word.isalpha() and word.isupper()
+
+
+class Matcher:
+    """キーワードのどれかを含むか。ignore_space=True なら空白を無視して比べる
+
+    2 文字以下の英字の略語で大文字だけのもの（AI / IT / DX）は別の正規表現（short）
+    にし、小文字化しない NFKC のテキストに大文字・小文字を区別して当てる。
+    それ以外（5G などの短い英数字を含む）は NFKC + 小文字化したテキストに当てる
+    （pattern。2 文字以下の英数字は単語境界つき）。
+    """
+
+    def __init__(self, keywords, ignore_space: bool = False):
+        self.ignore_space = ignore_space
+        words = {self._strip(nfkc(k)) for k in keywords if k}
+        short = sorted(w for w in words if _acronym(w))
+        rest  = sorted({w.lower() for w in words if not _acronym(w)}, key=len, reverse=True)
+        self.short = (re.compile("|".join(rf"(?<![A-Za-z0-9]){re.escape(w)}(?![A-Za-z0-9])"
+                                          for w in short)) if short else None)
+        alts = [rf"(?<![a-z0-9]){re.escape(w)}(?![a-z0-9])" if _short_ascii(w) else re.escape(w)
+                for w in rest]
+        self.pattern = re.compile("|".join(alts)) if alts else None
+
+    def _strip(self, text: str) -> str:
+        return _SPACE.sub("", text) if self.ignore_space else text
+
+    def hit_nfkc(self, text: str, norm: str = None) -> bool:
+        """NFKC 済みのテキストに対する判定。小文字化したもの（norm）があれば渡す"""
+        if self.short is not None and self.short.search(self._strip(text)):
+            return True
+        if self.pattern is None:
+            return False
+        norm = text.lower() if norm is None else norm
+        return self.pattern.search(self._strip(norm)) is not None
+
+    def hit(self, text: str) -> bool:
+        return self.hit_nfkc(nfkc(text))
+
+    __call__ = hit
+
+
+class Document:
+    """取得したページ 1 枚。各表現は初回アクセス時に作ってキャッシュする"""
+
+    def __init__(self, content, encoding: str = None):
+        self.content  = content
+        self.encoding = encoding
+
+    @cached_property
+    def html(self) -> str:
+        if isinstance(self.content, str):
+            return self.content
+        import parsepool
+        return parsepool.decode(self.content, self.encoding)
+
+    @cached_property
+    def soup(self):
+        """script / style などを除いてから解析した文書"""
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(_HIDDEN.sub("", self.html), "html.parser")
+
+    @cached_property
+    def text(self) -> str:
+        """表示テキスト（script / style を除く）"""
+        return self.soup.get_text()
+
+    @cached_property
+    def nfkc(self) -> str:
+        """text を NFKC にかけたもの（大文字・小文字はそのまま）"""
+        return nfkc(self.text)
+
+    @cached_property
+    def norm(self) -> str:
+        """nfkc を小文字化したもの"""
+        return self.nfkc.lower()
+
+    @cached_property
+    def headings(self) -> dict:
+        """{タグ名: 最初のテキスト}。first() で引いたものだけを覚える"""
+        return {}
+
+    def first(self, *tags) -> str:
+        """tags（title / h1 / h2 など）の順に探した最初のテキスト（無ければ ""）"""
+        for tag in tags:
+            if tag not in self.headings:
+                node = self.soup.find(tag)
+                self.headings[tag] = node.get_text(strip=True) if node else ""
+            if self.headings[tag]:
+                return self.headings[tag]
+        return ""
+
+    def matches(self, matcher: Matcher) -> bool:
+        return matcher.hit_nfkc(self.nfkc, self.norm)
+
+    def date(self, kinds=jpdate.DEFAULT_KINDS, tz=jpdate.JST):
+        """<time>・見出し付近 → 表示テキスト全体 の順に探した掲載日"""
+        return (jpdate.find_date_soup(self.soup, kinds, tz, fallback=False)
+                or jpdate.find_date(self.text, kinds, tz))
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+feeds.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  RSS 1.0 (RDF) / RSS 2.0 / Atom 共通のフィード取り込み。
+  ・応答を少しずつ受け取りながら XMLPullParser で解析し、ルート要素で形式を判定
+  ・新しい順のフィードは、窓 (since) より古い項目が STALE_LIMIT 件続いた時点で
+    読むのをやめる（残りはダウンロードもしない）
+  ・ETag / Last-Modified による条件付き GET。304 なら前回の項目を使う
+  ・フィードごとの水位 (前回見た最新の日時) を保存し、新着のみモードでは
+    水位より古い項目を読まない（新しい順のフィードだけ。順不同の検索フィードは
+    後から古い日付の記事が載るので水位を使わず、重複は項目ストアで除く）
+  ・読んだところまでの本文は snapshots に保存する（再処理用）
+  ・feeds.toml に書くだけで新しいフィードをセクションとして追加できる
+
+  read(url, since)  : 窓内の Entry のリスト
+  sections()        : feeds.toml に定義されたセクション {名前: FeedSection}
+
+feeds.toml の例:
+    [[feed]]
+    name     = "ppc"                          # --sources で使う名前
+    title    = "【個人情報保護委員会】"
+    url      = "https://example.go.jp/news.rdf"
+    days     = 4                              # 省略時 4
+    keywords = ["デジタル", "AI"]              # 省略時は全件
+"""
+
+import html
+import os
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+
+import scheduler
+from document import Matcher
+
+JST = timezone(timedelta(hours=9))
+
+CHUNK       = 16 * 1024
+STALE_LIMIT = 3         # 窓より古い項目がこれだけ続いたら打ち切り（多少の順不同は許す）
+CONFIG      = os.environ.get("IT_MONITOR_FEEDS",
+                             os.path.join(os.path.dirname(os.path.abspath(__file__)), "feeds.toml"))
+
+NS = {
+    "rdf":  "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "rss1": "http://purl.org/rss/1.0/",
+    "dc":   "http://purl.org/dc/elements/1.1/",
+    "atom": "http://www.w3.org/2005/Atom",
+}
+_q = lambda ns, tag: f"{{{NS[ns]}}}{tag}"
+
+# 形式ごとの (項目タグ, タイトル, リンク, 日付の候補, 概要の候補)
+FORMATS = {
+    "rdf":  (_q("rss1", "item"), _q("rss1", "title"), _q("rss1", "link"),
+             (_q("dc", "date"),), (_q("rss1", "description"),)),
+    "rss2": ("item", "title", "link",
+             ("pubDate", _q("dc", "date")), ("description",)),
+    "atom": (_q("atom", "entry"), _q("atom", "title"), _q("atom", "link"),
+             (_q("atom", "published"), _q("atom", "updated")),
+             (_q("atom", "summary"), _q("atom", "content"))),
+}
+
+_TAG = re.compile(r"<[^>]+>")
+_WS  = re.compile(r"\s+")
+
+
+class Entry:
+    __slots__ = ("dt", "title", "link", "summary")
+
+    def __init__(self, dt: datetime, title: str, link: str, summary: str = ""):
+        self.dt, self.title, self.link, self.summary = dt, title, link, summary
+
+    def dump(self):
+        return [self.dt.isoformat(), self.title, self.link, self.summary]
+
+    @classmethod
+    def load(cls, row):
+        return cls(datetime.fromisoformat(row[0]), *row[1:])
+
+    def item(self, source: str):
+        """item.Item にする（要約は body として検索索引に入る）"""
+        from item import Item
+        extra = {"body": self.summary} if self.summary else {}
+        return Item(source, self.dt, self.title, self.link, **extra)
+
+
+def detect(root_tag: str):
+    """ルート要素のタグから形式名（不明なら None）"""
+    if root_tag == _q("rdf", "RDF"):
+        return "rdf"
+    if root_tag == "rss":
+        return "rss2"
+    if root_tag == _q("atom", "feed"):
+        return "atom"
+    return None
+
+
+def parse_date(text: str):
+    """RFC 822（pubDate）と ISO 8601（dc:date, Atom）の両方を受け、JST で返す"""
+    text = (text or "").strip()
+    if not text:
+        return None
+    try:
+        dt = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=JST)
+    return dt.astimezone(JST)
+
+
+def plain(text: str) -> str:
+    """概要などに混じる HTML を落として 1 行にする"""
+    return _WS.sub(" ", _TAG.sub(" ", html.unescape(text or ""))).strip()
+
+
+def _entry(elem, fmt):
+    _, t_title, t_link, t_dates, t_sums = FORMATS[fmt]
+    title = plain(elem.findtext(t_title, ""))
+    if fmt == "atom":
+        links = elem.findall(t_link)
+        alt = [l for l in links if l.get("rel", "alternate") == "alternate"] or links
+        link = alt[0].get("href", "") if alt else ""
+    else:
+        link = (elem.findtext(t_link) or "").strip()
+    dt = next((d for d in (parse_date(elem.findtext(t)) for t in t_dates) if d), None)
+    summary = next((s for s in (elem.findtext(t) for t in t_sums) if s), "")
+    return Entry(dt, title, link, plain(summary)) if dt and title else None
+
+
+def iter_entries(chunks, since: datetime = None, ordered: bool = True):
+    """バイト列の断片を順に解析して Entry を返す。
+    ordered なら since より古い項目が STALE_LIMIT 件続いたところで止まる"""
+    from xml.etree.ElementTree import XMLPullParser
+
+    parser = XMLPullParser(events=("start", "end"))
+    fmt, item_tag, stale = None, None, 0
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if fmt is None:
+                if event != "start":
+                    continue
+                fmt = detect(elem.tag)
+                if fmt is None:
+                    raise ValueError(f"unknown feed format: {elem.tag}")
+                item_tag = FORMATS[fmt][0]
+                continue
+            if event != "end" or elem.tag != item_tag:
+                continue
+            e = _entry(elem, fmt)
+            elem.clear()
+            if e is None:
+                continue
+            if since is not None and e.dt < since:
+                stale += 1
+                if ordered and stale >= STALE_LIMIT:
+                    return
+                continue
+            stale = 0
+            yield e
+
+
+def read(url: str, since: datetime, *, ordered: bool = True, headers=None, timeout=30):
+    """url のフィードから since 以降の Entry を返す（条件付き GET・水位つき）"""
+    import fetcher
+    import snapshots
+    from item_store import open_store
+
+    store = open_store()
+    state = store.feed_state(url)
+    cutoff = since
+    if store.new_only and ordered and state and state["newest"]:
+        # 新着のみ: 前回見た最新より古いものは読まない（順不同のフィードでは
+        # 古い日付の記事が後から載るので使わない）
+        cutoff = max(since, datetime.fromisoformat(state["newest"]))
+
+    headers = dict(headers or {})
+    # 前回の保存分が今回の窓を覆っているときだけ条件付きにする
+    if state and datetime.fromisoformat(state["cutoff"]) <= cutoff:
+        if state["etag"]:
+            headers["If-None-Match"] = state["etag"]
+        if state["last_modified"]:
+            headers["If-Modified-Since"] = state["last_modified"]
+
+    resp = fetcher.get(url, headers=headers, timeout=timeout, stream=True)
+    try:
+        if resp.status_code == 304:
+            return [e for e in map(Entry.load, state["entries"]) if e.dt >= cutoff]
+        resp.raise_for_status()
+        got = []        # 読んだところまでを snapshots に残す
+        chunks = (got.append(c) or c for c in resp.iter_content(CHUNK))
+        entries = list(iter_entries(chunks, cutoff, ordered))
+    finally:
+        resp.close()
+    snapshots.record(url, b"".join(got), resp.status_code,
+                     resp.headers.get("Content-Type"), resp.encoding, resp.url)
+
+    newest = max((e.dt for e in entries), default=None)
+    if state and state["newest"]:
+        newest = max(filter(None, (newest, datetime.fromisoformat(state["newest"]))))
+    store.put_feed_state(url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"),
+                         newest.isoformat() if newest else None, cutoff.isoformat(),
+                         [e.dump() for e in entries])
+    return entries
+
+
+# ───────── 設定だけで追加するフィード
+def keyword_filter(keywords):
+    """NFKC + 小文字化して部分一致（2 文字の英字は単語境界つき）。空なら全件通す"""
+    if not keywords:
+        return lambda text: True
+    return Matcher(keywords).hit
+
+
+class FeedSection:
+    """feeds.toml の [[feed]] 1 件。watchers の各モジュールと同じ顔を持つ"""
+
+    def __init__(self, conf: dict):
+        self.name    = conf["name"]
+        self.TITLE   = conf.get("title", f"【{self.name}】")
+        self.urls    = conf.get("urls") or [conf["url"]]
+        self.days    = int(conf.get("days", 4))
+        self.BUDGET  = conf.get("budget", 45)
+        self.POLL_SEC = conf.get("poll", 900)
+        self.NEWEST_FIRST = bool(conf.get("newest_first", True))
+        self.ordered = bool(conf.get("ordered", True))
+        self.match   = keyword_filter(conf.get("keywords"))
+
+    def collect(self, today=None):
+        from watchers import jst_today
+
+        today = jst_today(today)
+        since = today - timedelta(days=self.days)
+        items = []
+        budget = scheduler.current()
+        for url in self.urls:
+            if budget.stop():
+                break
+            try:
+                entries = read(url, since, ordered=self.ordered)
+            except Exception as e:
+                budget.partial()      # この URL は取りこぼし。残りの URL は読む
+                print(f"[WARN] {self.name} {url}: {e}", file=sys.stderr)
+                continue
+            for e in entries:
+                if e.dt < today + timedelta(days=1) and self.match(e.title + " " + e.summary):
+                    items.append(e.item(self.name))
+        return items
+
+    def render(self, items, today=None) -> str:
+        out = [self.TITLE]
+        if not items:
+            out.append("DXやデジタル化に関連する新着情報および審議会等の開催はいずれもなし\n")
+        for r in items:
+            out.append(f"○{r.label()}　{r.title}\n　{r.url}\n")
+        return "\n".join(out) + "\n"
+
+
+def sections(path: str = CONFIG) -> dict:
+    """feeds.toml のセクション {名前: FeedSection}（ファイルが無ければ空）"""
+    if not os.path.exists(path):
+        return {}
+    import tomllib
+    try:
+        with open(path, "rb") as f:
+            conf = tomllib.load(f)
+        return {s.name: s for s in map(FeedSection, conf.get("feed", []))}
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[WARN] {path}: {e}", file=sys.stderr)
+        return {}
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+fetcher.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  全セクション共通の HTTP GET。
+  ・タイムアウトは scheduler の持ち時間で切り詰める
+  ・ホスト単位のサーキットブレーカー
+      タイムアウト / 接続失敗 / 5xx が FAIL_LIMIT 回続くと一定時間そのホストへの
+      通信をやめ、即座に CircuitOpen を投げる。冷却後は 1 本だけ試し (half-open)、
+      成功すれば復帰、失敗すれば冷却時間を倍にして再度遮断する
+  ・ヘッジ付き GET (hedge=True)
+      ホストの応答時間 p95 を過ぎても返らなければ同じ GET をもう 1 本送り、
+      先に返った方を使う（冪等な GET にだけ使うこと）
+  ・playwright など requests 以外の取得も guard(url) でブレーカーに載せられる
+  ・session を渡さない取得はプロセス内で共有する Session を使い、
+    ホストごとの接続（TLS を含む）を次の取得・次の巡回へ持ち越す
+  ・実行内の重複取得をまとめる (single-flight)
+      正規化 URL（+ User-Agent 以外のヘッダ）が同じ GET は、実行中のものがあれば
+      その結果を待って共有し、済んだものは応答を使い回す。保持する応答は
+      本文の合計が CACHE_BYTES を超えたら古いものから捨てる。
+      stream=True やその他の引数つきの取得は対象外。省けた件数は stats() で見られる
+
+  ・取得した本文は snapshots に保存し、snapshots.replay() の間は通信せず
+    保存分を返す（reprocess.py）
+
+  get(url, ...)      : requests.Response を返す（遮断中は CircuitOpen）
+  guard(url)         : with 文でブレーカーの判定と結果記録だけを行う
+  stats() / summary(): 今回の実行の取得数と、重複をまとめて省いた数
+  new_run()          : 使い回す応答と集計を捨てる（常駐モードで巡回ごとに呼ぶ）
+
+requests を読み込むので、各セクションは使う関数の中で import すること。
+"""
+
+import copy
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+
+import scheduler
+import snapshots
+from item_store import canonical_url
+
+UA = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+      "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125 Safari/537.36")
+
+FAIL_LIMIT    = 3       # 連続失敗でブレーカーを開く回数
+COOLDOWN_SEC  = 60      # 最初の遮断時間
+COOLDOWN_MAX  = 600
+HEDGE_MIN_SEC = 0.3     # ヘッジまでの最短待ち
+HEDGE_DEFAULT = 2.0     # 計測値が少ないうちの待ち時間
+SAMPLES       = 50      # p95 を取る直近サンプル数
+POOL_HOSTS    = 32      # 接続を保持するホスト数
+POOL_PER_HOST = 8       # ホストごとに保持する接続数（並行するセクション・ヘッジ分）
+CACHE_BYTES   = 64 * 1024 * 1024    # 使い回す応答の本文の合計上限
+
+
+class CircuitOpen(requests.RequestException):
+    """遮断中のホストへの取得（既存の except requests.RequestException で拾える）"""
+
+
+class Host:
+    def __init__(self):
+        self.lock      = threading.Lock()
+        self.fails     = 0
+        self.open_till = 0.0
+        self.cooldown  = COOLDOWN_SEC
+        self.probing   = False
+        self.latency   = deque(maxlen=SAMPLES)
+
+    # ───────── ブレーカー
+    def allow(self) -> bool:
+        with self.lock:
+            if self.fails < FAIL_LIMIT:
+                return True
+            if time.monotonic() < self.open_till or self.probing:
+                return False
+            self.probing = True          # half-open: 1 本だけ通す
+            return True
+
+    def success(self, elapsed: float):
+        with self.lock:
+            self.latency.append(elapsed)
+            self.fails, self.probing, self.cooldown = 0, False, COOLDOWN_SEC
+
+    def failure(self):
+        with self.lock:
+            self.fails += 1
+            if self.probing:
+                self.cooldown = min(self.cooldown * 2, COOLDOWN_MAX)
+            self.probing = False
+            if self.fails >= FAIL_LIMIT:
+                self.open_till = time.monotonic() + self.cooldown
+
+    def release(self):
+        """ホストの不調とは言えない失敗（リダイレクト過多など）。試行枠だけ返す"""
+        with self.lock:
+            self.probing = False
+
+    def hedge_delay(self) -> float:
+        with self.lock:
+            samples = sorted(self.latency)
+        if len(samples) < 5:
+            return HEDGE_DEFAULT
+        return max(HEDGE_MIN_SEC, samples[int(len(samples) * 0.95) - 1])
+
+
+_hosts = {}
+_hosts_lock = threading.Lock()
+
+def host(url: str) -> Host:
+    name = urlsplit(url).netloc.lower()
+    with _hosts_lock:
+        return _hosts.setdefault(name, Host())
+
+
+@contextmanager
+def guard(url: str):
+    """with guard(url): ... の中の取得をブレーカーに載せる"""
+    if snapshots.replaying():
+        yield
+        return
+    h = host(url)
+    if not h.allow():
+        raise CircuitOpen(f"circuit open: {urlsplit(url).netloc}")
+    t0 = time.monotonic()
+    try:
+        yield
+    except Exception:
+        h.failure()
+        raise
+    h.success(time.monotonic() - t0)
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+def shared_session() -> requests.Session:
+    """session 省略時に使う共有 Session（接続プールを持ち越す）"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_HOSTS,
+                                                    pool_maxsize=POOL_PER_HOST)
+            _shared.mount("https://", adapter)
+            _shared.mount("http://", adapter)
+        return _shared
+
+
+def _send(session, url, headers, timeout, kw):
+    session = session if session is not None else shared_session()
+    return session.get(url, headers=headers, timeout=timeout, **kw)
+
+
+def _hedged(h, session, url, headers, timeout, kw):
+    """1 本目が p95 を過ぎても返らなければ 2 本目を送り、先に成功した方を返す"""
+    results = queue.Queue()
+
+    def run():
+        try:
+            results.put((True, _send(session, url, headers, timeout, kw)))
+        except Exception as e:
+            results.put((False, e))
+
+    threading.Thread(target=run, daemon=True).start()
+    try:
+        ok, val = results.get(timeout=h.hedge_delay())
+        pending = 0
+    except queue.Empty:
+        threading.Thread(target=run, daemon=True).start()
+        ok, val = results.get()
+        pending = 1
+    # 先着が失敗でも、もう 1 本が残っていればそちらを待つ
+    while not ok and pending:
+        ok, val = results.get()
+        pending -= 1
+    if not ok:
+        raise val
+    return val
+
+
+class _Flights:
+    """実行中の GET と、済んだ応答（本文サイズで上限つきの LRU）"""
+
+    def __init__(self, limit: int = CACHE_BYTES):
+        self.lock     = threading.Lock()
+        self.limit    = limit
+        self.inflight = {}              # key → Future
+        self.done     = OrderedDict()   # key → (Response, 本文バイト数)
+        self.size     = 0
+        self.new_run()
+
+    def new_run(self):
+        with self.lock:
+            self.done.clear()
+            self.size = 0
+            self.counts = {"requests": 0, "joined": 0, "reused": 0, "evicted": 0}
+
+    def claim(self, key):
+        """(済んだ応答 or None, 待つべき Future or None, 自分が取得役か)"""
+        with self.lock:
+            self.counts["requests"] += 1
+            if key in self.done:
+                self.done.move_to_end(key)
+                self.counts["reused"] += 1
+                return self.done[key][0], None, False
+            if key in self.inflight:
+                self.counts["joined"] += 1
+                return None, self.inflight[key], False
+            fut = self.inflight[key] = Future()
+            return None, fut, True
+
+    def settle(self, key, fut, resp=None, exc=None):
+        with self.lock:
+            self.inflight.pop(key, None)
+            # 5xx や失敗は残さない（次の取得でやり直す）
+            if exc is None and resp.status_code < 500:
+                n = len(resp.content or b"")
+                if n <= self.limit:
+                    self.done[key] = (resp, n)
+                    self.size += n
+                    while self.size > self.limit:
+                        _, (_, m) = self.done.popitem(last=False)
+                        self.size -= m
+                        self.counts["evicted"] += 1
+        if exc is None:
+            fut.set_result(resp)
+        else:
+            fut.set_exception(exc)
+
+
+_flights = _Flights()
+
+
+def stats() -> dict:
+    """{requests: 呼び出し数, joined: 実行中に相乗り, reused: 済んだ応答を再利用,
+        saved: 省けた通信, evicted: 上限で捨てた応答}"""
+    with _flights.lock:
+        c = dict(_flights.counts)
+    c["saved"] = c["joined"] + c["reused"]
+    return c
+
+
+def summary() -> str:
+    """stats() を 1 行にしたもの（実行の最後に標準エラーへ出す）"""
+    c = stats()
+    return (f"[fetch] {c['requests']} requests, {c['saved']} saved "
+            f"({c['joined']} joined in flight, {c['reused']} reused, {c['evicted']} evicted)")
+
+
+def new_run() -> None:
+    _flights.new_run()
+
+
+def _flight_key(url, headers):
+    extra = tuple(sorted((k.lower(), v) for k, v in (headers or {}).items()
+                         if k.lower() != "user-agent"))
+    return canonical_url(url), extra
+
+
+def _wait_sec(timeout) -> float:
+    """相乗りした取得を待つ上限（connect + read）"""
+    t = scheduler.current().timeout(timeout)
+    return sum(t) if isinstance(t, tuple) else t
+
+
+def get(url: str, headers=None, timeout=20, session=None, hedge: bool = False, **kw):
+    """共通 GET。timeout は (connect, read) も可。5xx は例外にせず応答を返す。
+    同じ URL の取得は実行内で 1 回にまとめる（stream などの引数があるときを除く）"""
+    if kw:
+        return _get(url, headers, timeout, session, hedge, **kw)
+
+    key = _flight_key(url, headers)
+    resp, fut, leader = _flights.claim(key)
+    if resp is not None:
+        return copy.copy(resp)
+    if not leader:
+        try:
+            return copy.copy(fut.result(timeout=_wait_sec(timeout)))
+        except FutureTimeout:
+            raise requests.Timeout(f"timed out waiting for shared request: {url}")
+    try:
+        resp = _get(url, headers, timeout, session, hedge)
+    except BaseException as e:
+        _flights.settle(key, fut, exc=e)
+        raise
+    _flights.settle(key, fut, resp)
+    snapshots.record_response(resp)
+    return copy.copy(resp)
+
+
+def _get(url, headers, timeout, session, hedge, **kw):
+    if snapshots.replaying():
+        return snapshots.replayed(url)
+    h = host(url)
+    if not h.allow():
+        raise CircuitOpen(f"circuit open: {urlsplit(url).netloc}")
+
+    headers = dict(headers or {})
+    if session is None:
+        headers.setdefault("User-Agent", UA)
+    timeout = scheduler.current().timeout(timeout)
+
+    t0 = time.monotonic()
+    try:
+        if hedge:
+            resp = _hedged(h, session, url, headers, timeout, kw)
+        else:
+            resp = _send(session, url, headers, timeout, kw)
+    except (requests.Timeout, requests.ConnectionError):
+        h.failure()
+        raise
+    except Exception:
+        h.release()
+        raise
+    if resp.status_code >= 500:
+        h.failure()
+    else:
+        h.success(time.monotonic() - t0)
+    return resp
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+item.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  全セクション共通の項目型と、セクションをまたいだ重複検出。
+  ・Item は __slots__ の軽量クラスで、日付は datetime（JST）、URL は正規化済み
+    （表示用の「6月9日」は label() で都度作る）
+  ・並べ替えと同一セクション内の重複排除は unique() で 1 回だけ行う
+  ・CrossIndex は 内閣府 RSS・各省ページ・Google News などに同じ発表が
+    載ったものを、正規化 URL または 正規化タイトル + 日付(±1日) で見つける
+"""
+
+import re
+import unicodedata
+from datetime import datetime, timedelta, timezone
+
+from item_store import canonical_url, item_key
+
+JST = timezone(timedelta(hours=9))
+
+TITLE_MIN  = 10     # これより短い正規化タイトルは一致判定に使わない（「人事異動」など）
+CROSS_DAYS = 1      # タイトル一致とみなす日付のずれ
+
+_NEWS_SUFFIX = re.compile(r"\s+[-－|｜]\s+[^-－|｜]+$")   # Google News の「 - 媒体名」
+_NON_WORD    = re.compile(r"[\W_]+")
+
+
+class Item:
+    """1 件の項目。dt は JST（日付しか無いものは 0 時）、extra はセクション固有の値"""
+
+    __slots__ = ("source", "dt", "title", "url", "key", "extra")
+
+    def __init__(self, source: str, dt: datetime, title: str, url: str = "",
+                 by_url: bool = True, **extra):
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=JST)
+        self.source = source
+        self.dt     = dt.astimezone(JST)
+        self.title  = title
+        self.url    = canonical_url(url)
+        # セクション内での同一性（URL を共有する項目は by_url=False で日付+タイトル）
+        self.key    = item_key(self.dt, title, self.url, by_url)
+        self.extra  = extra or None
+
+    def __repr__(self):
+        return f"Item({self.source!r}, {self.dt:%Y-%m-%d}, {self.title!r})"
+
+    def get(self, name: str, default=None):
+        return self.extra.get(name, default) if self.extra else default
+
+    def label(self) -> str:
+        """レポート用の「6月9日」"""
+        return f"{self.dt.month}月{self.dt.day}日"
+
+    def sort_key(self):
+        return (self.dt, self.title)
+
+    def to_dict(self) -> dict:
+        d = {"date": self.dt.date().isoformat(), "dt": self.dt.isoformat(),
+             "title": self.title, "url": self.url}
+        if self.extra:
+            d.update(self.extra)
+        return d
+
+    def dump(self) -> dict:
+        """保存用（to_dict にキーを加えたもの）"""
+        return {**self.to_dict(), "key": self.key}
+
+    @classmethod
+    def load(cls, source: str, d: dict) -> "Item":
+        """dump() / to_dict() の逆"""
+        d = dict(d)
+        d.pop("date", None)
+        key = d.pop("key", None)
+        it = cls(source, datetime.fromisoformat(d.pop("dt")), d.pop("title"),
+                 d.pop("url", ""), **d)
+        if key:
+            it.key = key
+        return it
+
+
+def unique(items, newest_first: bool = False):
+    """(日付, タイトル) 順に並べ、同じキーの項目は最初の 1 件だけ残す"""
+    seen, out = set(), []
+    for it in sorted(items, key=Item.sort_key, reverse=newest_first):
+        if it.key in seen:
+            continue
+        seen.add(it.key)
+        out.append(it)
+    return out
+
+
+def title_key(title: str) -> str:
+    """媒体名・記号・空白を除いて NFKC + 小文字化したタイトル"""
+    t = _NEWS_SUFFIX.sub("", unicodedata.normalize("NFKC", title))
+    return _NON_WORD.sub("", t).lower()
+
+
+class CrossIndex:
+    """先に登録したセクションを正として、後のセクションの同一発表を見つける"""
+
+    def __init__(self, days: int = CROSS_DAYS):
+        self.days     = days
+        self.by_url   = {}          # 正規化 URL → セクション
+        self.by_title = {}          # 正規化タイトル → [(日付, セクション)]
+
+    def find(self, it: Item):
+        """it と同じ発表を先に登録したセクション名（無ければ None）"""
+        if it.url and (src := self.by_url.get(it.url)) and src != it.source:
+            return src
+        tk = title_key(it.title)
+        if len(tk) < TITLE_MIN:
+            return None
+        d = it.dt.date()
+        for d0, src in self.by_title.get(tk, ()):
+            if src != it.source and abs((d - d0).days) <= self.days:
+                return src
+        return None
+
+    def add(self, items):
+        """items を登録し、(残す項目, [(重複項目, 先のセクション)]) を返す"""
+        kept, dups = [], []
+        for it in items:
+            if src := self.find(it):
+                dups.append((it, src))
+                continue
+            kept.append(it)
+        for it in kept:
+            if it.url:
+                self.by_url.setdefault(it.url, it.source)
+            tk = title_key(it.title)
+            if len(tk) >= TITLE_MIN:
+                self.by_title.setdefault(tk, []).append((it.dt.date(), it.source))
+        return kept, dups
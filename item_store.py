@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+item_store.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  各セクションが抽出した項目をローカル SQLite に蓄積する。
+  ・項目は (ソース, 正規化URL) または (ソース, 日付|タイトル) で一意
+  ・初出 / 最終確認の時刻と実行回 (run) を保持
+  ・詳細ページから得た情報（記事日付・動画長など）を URL 単位でキャッシュし、
+    次回以降の再取得を省く
+  ・「前回実行以降の新着のみ」モード (IT_MONITOR_NEW_ONLY=1)
+  ・過去分の取得 (backfill.py) の進捗をチャンク単位で保存し、中断後に再開できるようにする
+  ・ページの解析結果を (本文の正規化ハッシュ, 判定の設定) とともに URL 単位で保存し、
+    どちらも前回と同じなら解析を省いて前回の結果を使う (parsepool.run_memo)
+  ・フィードごとの ETag / Last-Modified・水位・前回の項目 (feeds.py)
+  ・常駐モード (daemon.py) のセクションごとの巡回間隔
+  ・記録した項目の全文検索索引 (search.py)。SQLite FTS5 の trigram（文字 3-gram）で、
+    NFKC + 小文字化したタイトル・本文・URL を引く。項目を初めて記録したときに
+    1 行足すだけなので、日々の実行で増えるのは新しい項目の分だけ
+
+保存先は環境変数 IT_MONITOR_DB（既定: state/items.sqlite3）。
+読み取り専用 (readonly=True) で開くと、ファイルが無ければ FileNotFoundError に
+なり、スキーマの作成・索引の追加・実行回の記録をしない（search.py 用）。
+start_run=False は書き込みはするが実行回を記録しない（search.py --reindex 用。
+runs に行を足すと、次の実行の「前回実行以降」の基準がずれる）。
+"""
+
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from urllib.request import pathname2url
+
+JST = timezone(timedelta(hours=9))
+DEFAULT_DB = os.path.join("state", "items.sqlite3")
+
+# 追跡用クエリは URL の同一性に関係しないので落とす
+DROP_QUERY = ("utm_", "fbclid", "gclid")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    started  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    source      TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    date        TEXT,
+    title       TEXT,
+    url         TEXT,
+    first_seen  TEXT NOT NULL,
+    last_seen   TEXT NOT NULL,
+    first_run   INTEGER NOT NULL,
+    last_run    INTEGER NOT NULL,
+    PRIMARY KEY (source, key)
+);
+CREATE TABLE IF NOT EXISTS details (
+    source   TEXT NOT NULL,
+    url      TEXT NOT NULL,
+    value    TEXT NOT NULL,
+    fetched  TEXT NOT NULL,
+    PRIMARY KEY (source, url)
+);
+CREATE TABLE IF NOT EXISTS memos (
+    source   TEXT NOT NULL,
+    url      TEXT NOT NULL,
+    version  TEXT NOT NULL,
+    hash     TEXT NOT NULL,
+    records  TEXT NOT NULL,
+    fetched  TEXT NOT NULL,
+    PRIMARY KEY (source, url)
+);
+CREATE TABLE IF NOT EXISTS feeds (
+    url            TEXT PRIMARY KEY,
+    etag           TEXT,
+    last_modified  TEXT,
+    newest         TEXT,
+    cutoff         TEXT NOT NULL,
+    entries        TEXT NOT NULL,
+    fetched        TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS polls (
+    source    TEXT PRIMARY KEY,
+    interval  REAL NOT NULL,
+    next_due  TEXT NOT NULL,
+    changed   TEXT
+);
+CREATE TABLE IF NOT EXISTS backfill (
+    job      TEXT NOT NULL,
+    source   TEXT NOT NULL,
+    chunk    TEXT NOT NULL,
+    items    TEXT NOT NULL,
+    done     TEXT NOT NULL,
+    PRIMARY KEY (job, source, chunk)
+);
+"""
+# trigram は SQLite 3.34 以降。使えなければ検索索引なしで動く
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(
+    source UNINDEXED, date UNINDEXED, title UNINDEXED, url UNINDEXED, body UNINDEXED,
+    norm, tokenize = 'trigram'
+);
+"""
+
+
+def canonical_url(url: str) -> str:
+    """スキーム・ホストを小文字化し、フラグメントと追跡用クエリを除いた URL"""
+    if not url:
+        return ""
+    p = urlsplit(url.strip())
+    query = urlencode([(k, v) for k, v in parse_qsl(p.query, keep_blank_values=True)
+                       if not k.lower().startswith(DROP_QUERY)])
+    path = p.path or "/"
+    return urlunsplit((p.scheme.lower(), p.netloc.lower(), path, query, ""))
+
+
+def item_key(date, title: str, url: str = "", by_url: bool = True) -> str:
+    """URL があればそれを、無ければ (日付, タイトル) をキーにする"""
+    if by_url and url:
+        return canonical_url(url)
+    if isinstance(date, datetime):
+        date = date.strftime("%Y-%m-%d")
+    return f"{date}|{title}"
+
+
+def _dump_dt(o):
+    if isinstance(o, datetime):
+        return {"$dt": o.isoformat()}
+    raise TypeError(f"{type(o).__name__} is not JSON serializable")
+
+def _load_dt(d: dict):
+    return datetime.fromisoformat(d["$dt"]) if d.keys() == {"$dt"} else d
+
+
+def _has_word(text: str, word: str) -> bool:
+    """search() の短い語の判定（英数字だけの語は前後が英数字でないこと）"""
+    if not word.isascii() or not word.isalnum():
+        return word in text
+    return re.search(rf"(?<![a-z0-9]){re.escape(word)}(?![a-z0-9])", text) is not None
+
+
+class ItemStore:
+    def __init__(self, path: str = DEFAULT_DB, new_only: bool = False, readonly: bool = False,
+                 start_run: bool = True):
+        self.path = path
+        self.new_only = new_only
+        self.readonly = readonly
+        # セクションは並行実行されるので接続を共有しロックで直列化する
+        self.lock = threading.RLock()
+        if readonly:
+            self._open_readonly(path)
+            return
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+        try:
+            self.db.executescript(SEARCH_SCHEMA)
+            self.searchable = True
+        except sqlite3.OperationalError as e:
+            print(f"[WARN] full-text index unavailable: {e}", file=sys.stderr)
+            self.searchable = False
+        self.db.create_function("has_word", 2, _has_word, deterministic=True)
+        if self.searchable and not self.db.execute("SELECT 1 FROM search LIMIT 1").fetchone():
+            self.reindex()      # 索引より前からある項目
+        if start_run:
+            self.new_run()
+        else:
+            self.now = self.run_id = None
+
+    def _open_readonly(self, path: str) -> None:
+        """既存のファイルを読み取り専用で開く（作らない・書かない・run を始めない）"""
+        if path == ":memory:" or not os.path.isfile(path):
+            raise FileNotFoundError(f"item store not found: {path}")
+        uri = "file:" + pathname2url(os.path.abspath(path)) + "?mode=ro"
+        self.db = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self.db.create_function("has_word", 2, _has_word, deterministic=True)
+        self.searchable = self.db.execute(
+            "SELECT 1 FROM sqlite_master WHERE name='search'").fetchone() is not None
+        self.now = self.run_id = None
+
+    def new_run(self) -> int:
+        """実行回を 1 つ進める（常駐モードでは巡回 1 回ごとに呼ぶ）"""
+        with self.lock, self.db:
+            self.now = datetime.now(JST).isoformat(timespec="seconds")
+            cur = self.db.execute("INSERT INTO runs (started) VALUES (?)", (self.now,))
+            self.run_id = cur.lastrowid
+        return self.run_id
+
+    # ───────── 項目
+    def _record(self, source: str, key: str, date, title: str, url: str,
+                body: str = "") -> bool:
+        """項目を記録し、今回の実行で初めて見たものなら True を返す"""
+        if isinstance(date, datetime):
+            date = date.strftime("%Y-%m-%d")
+        with self.lock, self.db:
+            row = self.db.execute(
+                "SELECT first_run FROM items WHERE source=? AND key=?",
+                (source, key)).fetchone()
+            if row is None:
+                cur = self.db.execute(
+                    "INSERT INTO items VALUES (?,?,?,?,?,?,?,?,?)",
+                    (source, key, date, title, url,
+                     self.now, self.now, self.run_id, self.run_id))
+                self._index(cur.lastrowid, source, date, title, url, body)
+                return True
+            self.db.execute(
+                "UPDATE items SET last_seen=?, last_run=? WHERE source=? AND key=?",
+                (self.now, self.run_id, source, key))
+            return row[0] == self.run_id
+
+    def keep_item(self, it) -> bool:
+        """item.Item を記録したうえで、レポートに出すべきか（新着のみモードを考慮。
+        本文は extra の body）"""
+        fresh = self._record(it.source, it.key, it.dt, it.title, it.url, it.get("body") or "")
+        return fresh or not self.new_only
+
+    # ───────── 全文検索
+    def _index(self, rowid: int, source: str, date, title: str, url: str, body: str = "") -> None:
+        if not self.searchable:
+            return
+        from document import normalize
+        self.db.execute(
+            "INSERT INTO search (rowid, source, date, title, url, body, norm) "
+            "VALUES (?,?,?,?,?,?,?)",
+            (rowid, source, date, title, url, body or None,
+             normalize(" ".join(filter(None, (title, body, url))))))
+
+    def reindex(self) -> int:
+        """索引に無い項目（本文なし）を足し、足した数を返す"""
+        if not self.searchable:
+            return 0
+        with self.lock, self.db:
+            rows = self.db.execute(
+                "SELECT rowid, source, date, title, url FROM items "
+                "WHERE rowid NOT IN (SELECT rowid FROM search)").fetchall()
+            for row in rows:
+                self._index(*row)
+        return len(rows)
+
+    def search(self, terms, sources=None, since: str = None, until: str = None,
+               every: bool = False, limit: int = 50):
+        """terms のどれか（every=True なら全部）を含む項目を新しい順に
+        [(source, date, title, url)] で返す。語は NFKC + 小文字化して部分一致。
+        3 文字以上の語は trigram 索引で引き、2 文字以下は索引の走査になる"""
+        from document import normalize
+        if not self.searchable:
+            if self.readonly:
+                raise RuntimeError("no full-text index in this store yet (run search.py --reindex once)")
+            raise RuntimeError("full-text index unavailable (SQLite 3.34+ with FTS5 required)")
+        conds, args = [], []
+        for t in terms:
+            t = normalize(t).strip()
+            if len(t) >= 3:
+                conds.append("norm GLOB ?")
+                args.append("*" + "".join(f"[{c}]" if c in "*?[" else c for c in t) + "*")
+            elif t:
+                # trigram は 3 文字未満を索引で引けない（和文は 0 件になる）ので走査する。
+                # 英数字だけの語は Matcher と同じく単語境界つき（"ai" が "mail" に当たらない）
+                conds.append("instr(norm, ?) > 0 AND has_word(norm, ?)")
+                args += [t, t]
+        if not conds:
+            return []
+        hits = (" INTERSECT " if every else " UNION ").join(
+            f"SELECT rowid FROM search WHERE {c}" for c in conds)
+        sql = f"SELECT source, date, title, url FROM search WHERE rowid IN ({hits})"
+        if sources:
+            sql += f" AND source IN ({','.join('?' * len(sources))})"
+            args += list(sources)
+        if since:
+            sql += " AND date >= ?"
+            args.append(since)
+        if until:
+            sql += " AND date <= ?"
+            args.append(until)
+        sql += " ORDER BY date DESC, rowid DESC LIMIT ?"
+        args.append(limit)
+        with self.lock:
+            return self.db.execute(sql, args).fetchall()
+
+    # ───────── 詳細ページのキャッシュ
+    def detail(self, source: str, url: str):
+        with self.lock:
+            row = self.db.execute(
+                "SELECT value FROM details WHERE source=? AND url=?",
+                (source, canonical_url(url))).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_detail(self, source: str, url: str, value) -> None:
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO details VALUES (?,?,?,?)",
+                (source, canonical_url(url),
+                 json.dumps(value, ensure_ascii=False), self.now))
+
+    # ───────── 解析結果のメモ
+    def memo(self, source: str, url: str):
+        """{"version", "hash", "records"}（datetime は復元する）"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT version, hash, records FROM memos WHERE source=? AND url=?",
+                (source, canonical_url(url))).fetchone()
+        if row is None:
+            return None
+        version, digest, records = row
+        return {"version": version, "hash": digest,
+                "records": json.loads(records, object_hook=_load_dt)}
+
+    def put_memo(self, source: str, url: str, version: str, digest: str, records) -> None:
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO memos VALUES (?,?,?,?,?,?)",
+                (source, canonical_url(url), version, digest,
+                 json.dumps(records, ensure_ascii=False, default=_dump_dt), self.now))
+
+    # ───────── フィードの状態
+    def feed_state(self, url: str):
+        with self.lock:
+            row = self.db.execute(
+                "SELECT etag, last_modified, newest, cutoff, entries FROM feeds WHERE url=?",
+                (url,)).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, newest, cutoff, entries = row
+        return {"etag": etag, "last_modified": last_modified, "newest": newest,
+                "cutoff": cutoff, "entries": json.loads(entries)}
+
+    def put_feed_state(self, url: str, etag, last_modified, newest, cutoff: str,
+                       entries) -> None:
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO feeds VALUES (?,?,?,?,?,?,?)",
+                (url, etag, last_modified, newest, cutoff,
+                 json.dumps(entries, ensure_ascii=False), self.now))
+
+    # ───────── 常駐モードの巡回間隔
+    def poll_state(self, source: str):
+        """(間隔秒, 次回予定 datetime, 最後に新着があった datetime or None)"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT interval, next_due, changed FROM polls WHERE source=?",
+                (source,)).fetchone()
+        if row is None:
+            return None
+        interval, next_due, changed = row
+        return (interval, datetime.fromisoformat(next_due),
+                datetime.fromisoformat(changed) if changed else None)
+
+    def put_poll_state(self, source: str, interval: float, next_due: datetime,
+                       changed: datetime = None) -> None:
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO polls VALUES (?,?,?,?)",
+                (source, interval, next_due.isoformat(timespec="seconds"),
+                 changed.isoformat(timespec="seconds") if changed else None))
+
+    # ───────── 過去分の取得の進捗
+    def chunks_done(self, job: str, source: str) -> dict:
+        """完了済みチャンク {chunk: [Item.dump() の dict]}"""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT chunk, items FROM backfill WHERE job=? AND source=?",
+                (job, source)).fetchall()
+        return {chunk: json.loads(items) for chunk, items in rows}
+
+    def put_chunk(self, job: str, source: str, chunk: str, items) -> None:
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO backfill VALUES (?,?,?,?,?)",
+                (job, source, chunk,
+                 json.dumps(items, ensure_ascii=False),
+                 datetime.now(JST).isoformat(timespec="seconds")))
+
+    def drop_job(self, job: str) -> None:
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM backfill WHERE job=?", (job,))
+
+    def close(self) -> None:
+        with self.lock:
+            self.db.close()
+
+
+_STORE = None
+_STORE_LOCK = threading.Lock()
+_CONFIG = {}
+
+def configure(path: str = None, new_only: bool = None, readonly: bool = None,
+              start_run: bool = None) -> None:
+    """open_store() より前に呼び、環境変数より優先する設定を与える（CLI 用）"""
+    if path is not None:
+        _CONFIG["path"] = path
+    if new_only is not None:
+        _CONFIG["new_only"] = new_only
+    if readonly is not None:
+        _CONFIG["readonly"] = readonly
+    if start_run is not None:
+        _CONFIG["start_run"] = start_run
+
+def open_store() -> ItemStore:
+    """プロセス内で共有するストアを返す（初回呼び出し時に run を開始。読み取り専用なら開始しない）"""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            path = _CONFIG.get("path") or os.environ.get("IT_MONITOR_DB", DEFAULT_DB)
+            new_only = _CONFIG.get("new_only",
+                                   os.environ.get("IT_MONITOR_NEW_ONLY") == "1")
+            _STORE = ItemStore(path, new_only=new_only,
+                               readonly=_CONFIG.get("readonly", False),
+                               start_run=_CONFIG.get("start_run", True))
+    return _STORE
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+jpdate.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  各セクションで重複していた日付抽出を 1 か所にまとめる。
+  ・令和 / 平成（元年を含む）、YYYY年M月D日、YYYY/M/D、YYYY-MM-DD
+  ・全角数字はパターン側で受け、一致した数字だけを半角化する
+    （文書全体への NFKC や 1 文字ずつの置換はしない）
+  ・HTML は <time>、見出し直後、<title> など日付が載る箇所だけを先に調べ、
+    見つからないときだけ文書全体を走査する
+
+  find_date(text, kinds)   : テキストから最初の日付
+  iter_dates(text, kinds)  : (datetime, match) を順に返す
+  find_date_html(html)     : 生 HTML から掲載日らしい日付
+  find_date_soup(soup)     : BeautifulSoup 済みの文書から同上
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+JST = timezone(timedelta(hours=9))
+
+ERA_BASE = {"令和": 2018, "平成": 1988}
+
+_D   = r"[0-9０-９]"
+_SP  = r"[ \t　]*"
+_ZEN = str.maketrans("０１２３４５６７８９／－", "0123456789/-")
+
+# 種類ごとに 1 度だけコンパイルしておく
+PATTERNS = {
+    "era":   re.compile(rf"(令和|平成){_SP}({_D}{{1,2}}|元){_SP}年{_SP}({_D}{{1,2}}){_SP}月{_SP}({_D}{{1,2}}){_SP}日"),
+    "ymd":   re.compile(rf"({_D}{{4}}){_SP}年{_SP}({_D}{{1,2}}){_SP}月{_SP}({_D}{{1,2}}){_SP}日"),
+    "slash": re.compile(rf"({_D}{{4}})[/／]({_D}{{1,2}})[/／]({_D}{{1,2}})"),
+    "iso":   re.compile(r"(\d{4})-(\d{2})-(\d{2})"),
+}
+DEFAULT_KINDS = ("era", "ymd", "slash", "iso")
+
+# HTML で日付が載りやすい箇所
+_TIME_ATTR = re.compile(r"<time\b[^>]*?\bdatetime\s*=\s*[\"']?(\d{4}-\d{2}-\d{2})", re.I)
+_ISO_DAY   = re.compile(r"\s*(\d{4})-(\d{2})-(\d{2})")  # datetime 属性の先頭（"2025-06" などは対象外）
+_TIME_TAG  = re.compile(r"<time\b[^>]*>(.*?)</time>", re.I | re.S)
+_HEADING   = re.compile(r"<h[1-3]\b[^>]*>(.*?)</h[1-3]>(.{0,600})", re.I | re.S)
+_TITLE     = re.compile(r"<title\b[^>]*>(.*?)</title>", re.I | re.S)
+_TAG       = re.compile(r"<[^>]+>")
+_HEAD_TAGS = ("h1", "h2", "h3")
+
+
+def _int(s: str) -> int:
+    return 1 if s == "元" else int(s.translate(_ZEN))
+
+
+def _to_dt(kind: str, groups, tz):
+    if kind == "era":
+        era, y, m, d = groups
+        return datetime(ERA_BASE[era] + _int(y), _int(m), _int(d), tzinfo=tz)
+    y, m, d = map(_int, groups)
+    return datetime(y, m, d, tzinfo=tz)
+
+
+def iter_dates(text: str, kinds=DEFAULT_KINDS, tz=JST):
+    """kinds の順に、text 中の日付を (datetime, match) で返す。暦にない日付は飛ばす"""
+    for kind in kinds:
+        for m in PATTERNS[kind].finditer(text):
+            try:
+                yield _to_dt(kind, m.groups(), tz), m
+            except ValueError:
+                continue
+
+
+def find_date(text: str, kinds=DEFAULT_KINDS, tz=JST):
+    """kinds の優先順で最初に見つかった日付（無ければ None）"""
+    if not text:
+        return None
+    for dt, _ in iter_dates(text, kinds, tz):
+        return dt
+    return None
+
+
+def html_regions(html: str):
+    """生 HTML から日付が載りやすい断片を優先度順に返す（タグは除去済み）"""
+    for m in _TIME_TAG.finditer(html):
+        yield _TAG.sub(" ", m.group(1))
+    for m in _HEADING.finditer(html):
+        yield _TAG.sub(" ", m.group(1) + " " + m.group(2))
+    if m := _TITLE.search(html):
+        yield m.group(1)
+
+
+def find_date_html(html: str, kinds=DEFAULT_KINDS, tz=JST, fallback: bool = True):
+    """<time datetime> → 局所領域 → （fallback 時のみ）文書全体 の順に探す"""
+    if m := _TIME_ATTR.search(html):
+        try:
+            return datetime(*map(int, m.group(1).split("-")), tzinfo=tz)
+        except ValueError:
+            pass
+    for region in html_regions(html):
+        if dt := find_date(region, kinds, tz):
+            return dt
+    return find_date(html, kinds, tz) if fallback else None
+
+
+def find_date_soup(soup, kinds=DEFAULT_KINDS, tz=JST, fallback: bool = True):
+    """find_date_html の BeautifulSoup 版（既に解析済みの文書向け）"""
+    if (t := soup.find("time", datetime=True)) and (m := _ISO_DAY.match(t["datetime"])):
+        try:
+            return datetime(*map(int, m.groups()), tzinfo=tz)
+        except ValueError:
+            pass
+    for t in soup.find_all("time"):
+        if dt := find_date(t.get_text(" "), kinds, tz):
+            return dt
+    for h in soup.find_all(_HEAD_TAGS):
+        sib = h.find_next_sibling()
+        text = h.get_text(" ") + " " + (sib.get_text(" ") if sib else "")
+        if dt := find_date(text, kinds, tz):
+            return dt
+    if soup.title and (dt := find_date(soup.title.get_text(), kinds, tz)):
+        return dt
+    return find_date(soup.get_text(" "), kinds, tz) if fallback else None
+
+
+def era_label(dt: datetime) -> str:
+    """datetime を「令和７年」のような全角数字の和暦年表記にする"""
+    for era, base in ERA_BASE.items():
+        if dt.year > base:
+            n = dt.year - base
+            label = "元" if n == 1 else str(n).translate(str.maketrans("0123456789", "０１２３４５６７８９"))
+            return f"{era}{label}年"
+    return f"{dt.year}年"
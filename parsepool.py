@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+parsepool.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  BeautifulSoup (html.parser) の解析は純 Python の CPU 処理で GIL を握るため、
+  取得を並行にしても解析で詰まる。これを別プロセスのプールへ逃がす。
+  ・子プロセスには生のバイト列（と HTTP ヘッダのエンコーディング）を渡し、
+    戻りはタイトル・日付・リンクなどの小さなレコードだけにする
+  ・run(fn, ...)    : 結果を待って返す（待つ間は GIL を手放すので他のセクションは進む）
+  ・submit(fn, ...) : concurrent.futures.Future を返す（result(fut, fn, ...) で待つ）
+  ・arun(fn, ...)   : asyncio から await できる版（イベントループを止めない）
+  ・fn はモジュール直下の関数であること（子プロセス側で import して呼ぶ）
+  ・run_memo(source, url, config, fn, ...) : 本文の正規化ハッシュ・引数・判定の設定
+    （キーワードなど）・解析のソースが前回と同じなら、解析せずに項目ストアに残した
+    前回の結果を返す。ETag / Last-Modified の無い一覧ページ向け。
+    解析のソースは fn のモジュール全体と、共通の下請け（PARSE_MODULES）のソース。
+    ソースが読めない環境ではメモを使わない
+    結果は JSON にできる値（と datetime）であること（タプルはリストで戻る）
+  ・IT_MONITOR_PARSE_WORKERS=0 でプロセスを使わずその場で解析する
+    （プールが壊れたときも同じくその場の解析に切り替える）
+"""
+
+import hashlib
+import multiprocessing
+import os
+import re
+import sys
+import threading
+from functools import lru_cache
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+WORKERS = int(os.environ.get("IT_MONITOR_PARSE_WORKERS", os.cpu_count() or 1))
+
+_META_CHARSET = re.compile(rb"<meta\s[^>]*?charset\s*=\s*[\"']?([A-Za-z0-9_.:-]+)", re.I)
+
+_pool = None
+_pool_lock = threading.Lock()
+_inline = WORKERS <= 0
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # fork はスレッドを抱えた親から作ると危ういので forkserver / spawn を使う
+            methods = multiprocessing.get_all_start_methods()
+            ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            _pool = ProcessPoolExecutor(max_workers=WORKERS, mp_context=ctx)
+        return _pool
+
+
+def submit(fn, *args) -> Future:
+    """fn(*args) をプールで実行する Future（インライン時は実行済みの Future）"""
+    global _inline
+    if not _inline:
+        try:
+            return _get_pool().submit(fn, *args)
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            print(f"[WARN] parse pool unavailable, parsing inline: {e}", file=sys.stderr)
+            _inline = True
+    fut = Future()
+    try:
+        fut.set_result(fn(*args))
+    except Exception as e:
+        fut.set_exception(e)
+    return fut
+
+
+def run(fn, *args):
+    """fn(*args) をプールで実行して結果を返す"""
+    return result(submit(fn, *args), fn, *args)
+
+
+def result(fut: Future, fn, *args):
+    """submit(fn, *args) の結果を待つ。プールが壊れていたらその場で解析し直す"""
+    global _inline
+    try:
+        return fut.result()
+    except BrokenProcessPool as e:
+        print(f"[WARN] parse pool broken, parsing inline: {e}", file=sys.stderr)
+        _inline = True
+        return fn(*args)
+
+
+# 解析関数が共通で使う下請け（日付・本文の正規化とキーワード判定・デコード）
+PARSE_MODULES = ("jpdate", "document", "parsepool")
+
+
+@lru_cache(maxsize=None)
+def _source_hash(module: str):
+    """モジュールのソースのハッシュ（読めなければ None）"""
+    import importlib
+    import inspect
+    try:
+        src = inspect.getsource(importlib.import_module(module))
+    except (OSError, TypeError):
+        return None
+    return hashlib.sha256(src.encode("utf-8")).hexdigest()
+
+
+def memo_version(fn, config=None):
+    """解析のソースと判定の設定から作るメモの版（どちらかが変われば前回の結果を使わない）。
+    プロセスをまたいでも同じ値になる。ソースが読めなければ None"""
+    hashes = [_source_hash(m) for m in (fn.__module__, *PARSE_MODULES)]
+    if None in hashes:
+        return None
+    ident = (fn.__module__, fn.__qualname__, *hashes, repr(config))
+    return hashlib.sha256(repr(ident).encode("utf-8")).hexdigest()
+
+
+def run_memo(source: str, url: str, config, fn, content, *args):
+    """run(fn, content, *args) と同じ結果。本文と版が前回と同じなら解析しない"""
+    from document import fingerprint
+    from item_store import open_store
+
+    version = memo_version(fn, config)
+    if version is None:
+        return run(fn, content, *args)
+    digest = hashlib.sha256(f"{fingerprint(content)}{args!r}".encode("utf-8")).hexdigest()
+    store = open_store()
+    if (memo := store.memo(source, url)) and (memo["version"], memo["hash"]) == (version, digest):
+        return memo["records"]
+    records = run(fn, content, *args)
+    store.put_memo(source, url, version, digest, records)
+    return records
+
+
+async def arun(fn, *args):
+    """run() の asyncio 版"""
+    import asyncio      # 読み込みが重いので使うときだけ
+    return await asyncio.wrap_future(submit(fn, *args))
+
+
+def shutdown() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+# ───────── 子プロセス側で使う小道具
+def decode(content: bytes, encoding: str = None) -> str:
+    """<meta charset> → HTTP ヘッダ → 内容からの推定 の順で決めたエンコーディングで復号"""
+    if m := _META_CHARSET.search(content[:4096]):
+        encoding = m.group(1).decode("ascii")
+    if not encoding:
+        from charset_normalizer import from_bytes
+        best = from_bytes(content).best()
+        encoding = best.encoding if best else "utf-8"
+    try:
+        return content.decode(encoding, "replace")
+    except LookupError:
+        return content.decode("utf-8", "replace")
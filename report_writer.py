@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+report_writer.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  セクションの結果を完了順に受け取り、既定の並び順で一時ファイルへ逐次書き出す。
+  ・先行セクションを待っているものだけをメモリに保持
+  ・全セクション完了後に一時ファイルを rename して差し替える
+    （途中で落ちても前回の result.md は壊れない）
+  ・同じ項目データから Markdown と JSON Lines の両方を出力
+  ・index (item.CrossIndex) を渡すと、先に書いたセクションと同じ発表を後のセクションから
+    省く（JSON Lines には dup_of 付きで残す）。そのため Markdown は書き出す直前に
+    項目から作れるよう、関数でも受け取る
+  ・append=True では差し替えの代わりに、書き終えた一時ファイルの中身を既存の
+    ファイルの末尾へ一度に追記する（常駐モードの差分レポート用）
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from collections import Counter
+from datetime import date, datetime
+
+REPORT_MODE = 0o644
+
+
+def _json_default(o):
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()
+    raise TypeError(f"{type(o).__name__} is not JSON serializable")
+
+
+def _open_tmp(path: str):
+    d = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=d, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    # mkstemp は 0600 で作るので、通常のレポートと同じ 0644 にする
+    # （umask を読むには一度書き換える必要があり、他のスレッドのファイル作成と競合する）
+    os.chmod(tmp, REPORT_MODE)
+    return open(fd, "w", encoding="utf-8"), tmp
+
+
+def _append(tmp: str, path: str) -> None:
+    """tmp の中身を path の末尾に足して tmp を消す"""
+    with open(tmp, "rb") as src, open(path, "ab") as dst:
+        shutil.copyfileobj(src, dst)
+        dst.flush()
+        os.fsync(dst.fileno())
+    os.unlink(tmp)
+
+
+class ReportWriter:
+    """order の順に Markdown / JSONL を書く。path に "-" を渡すと標準出力へ"""
+
+    def __init__(self, order, md_path: str = "result.md", jsonl_path: str = None,
+                 index=None, titles=None, append: bool = False, header: str = ""):
+        self.order   = list(order)
+        self.index   = index
+        self.titles  = titles or {}  # 重複の注記に使う見出し
+        self.pending = {}            # 先行セクション待ちの結果
+        self.next    = 0
+        self.lock    = threading.Lock()
+        self.append  = append
+        self.outs    = []            # (file, tmp_path, final_path, kind)
+        for path, kind in ((md_path, "md"), (jsonl_path, "jsonl")):
+            if not path:
+                continue
+            if path == "-":
+                self.outs.append((sys.stdout, None, None, kind))
+            else:
+                f, tmp = _open_tmp(path)
+                self.outs.append((f, tmp, path, kind))
+        for f, _, _, kind in self.outs:
+            if kind == "md" and header:
+                f.write(header)
+
+    # ───────── 受け取り
+    def submit(self, name: str, items, md, partial: bool = False) -> None:
+        """セクション name の結果を渡す。呼び出し順は問わない。
+        md は Markdown 文字列、または（重複を除いた）項目から作る関数"""
+        with self.lock:
+            if name not in self.order:
+                raise KeyError(name)
+            self.pending[name] = (items, md, partial)
+            while self.next < len(self.order) and self.order[self.next] in self.pending:
+                sec = self.order[self.next]
+                self._write(sec, *self.pending.pop(sec))
+                self.next += 1
+
+    def _write(self, name, items, md, partial=False):
+        dups = []
+        if self.index is not None:
+            items, dups = self.index.add(items)
+        if callable(md):
+            md = md(items)
+        if dups:
+            by = Counter(src for _, src in dups)
+            md += (f"※ 他のセクションと同じ発表 {len(dups)} 件を省略しました（"
+                   + "、".join(f"{self.titles.get(src, src)} {n} 件" for src, n in by.items()) + "）\n\n")
+        rows = [(it, {}) for it in items] + [(it, {"dup_of": src}) for it, src in dups]
+        for f, _, _, kind in self.outs:
+            if kind == "md":
+                f.write(md)
+            else:
+                for it, mark in rows:
+                    if partial:
+                        mark = {**mark, "partial": True}
+                    f.write(json.dumps({"source": name, **it.to_dict(), **mark},
+                                       ensure_ascii=False, default=_json_default) + "\n")
+            f.flush()
+
+    # ───────── 確定 / 破棄
+    def commit(self) -> None:
+        """未着セクションは飛ばして残りを書き、一時ファイルを本来の名前に置き換える"""
+        with self.lock:
+            for sec in self.order[self.next:]:
+                if sec in self.pending:
+                    self._write(sec, *self.pending.pop(sec))
+            self.next = len(self.order)
+            for f, tmp, path, _ in self.outs:
+                if tmp is None:
+                    continue
+                f.flush()
+                os.fsync(f.fileno())
+                f.close()
+                if self.append:
+                    _append(tmp, path)
+                else:
+                    os.replace(tmp, path)
+            self.outs = []
+
+    def abort(self) -> None:
+        with self.lock:
+            for f, tmp, _, _ in self.outs:
+                if tmp is None:
+                    continue
+                f.close()
+                try:
+                    os.unlink(tmp)
+                except FileNotFoundError:
+                    pass
+            self.outs = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
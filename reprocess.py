@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+reprocess.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  snapshots に保存した取得結果に、現在のキーワード・日付の判定をかけ直して
+  指定期間のレポートを作る（通信はしない）。
+  ・キーワードを足した・日付の読み方を直したときに、過去の日付で何が拾えたかを
+    サイトに負荷をかけずに確かめられる
+  ・(セクション, 基準日) ごとに、その日の終わりより前に取得した最新の本文で
+    collect(基準日) をそのまま動かす。取得は fetcher / browser が保存分から返す
+  ・(セクション, 基準日) の組は --workers 個のプロセスに分けて並行に処理する
+    （解析は各プロセスの中で行い、parsepool は使わない）
+  ・項目ストアは使わない（メモリ上の一時ストア）。本番の新着判定や詳細ページの
+    キャッシュには影響しない
+  ・保存分の無い URL は取得失敗と同じ扱いになり、その組は「途中まで」と明記する
+
+使い方:
+    python reprocess.py --from 2026-09-01 --to 2026-09-30
+    python reprocess.py --from 2026-10-01 --to 2026-10-19 --sources cao,meti -o - --workers 8
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
+
+import item_store
+import scheduler
+import snapshots
+from backfill import empty_section
+from IT_monitoring import parse_date, parse_sources
+from item import CrossIndex, Item
+from report_writer import ReportWriter
+from watchers import ORDER, finish, jst_today, load
+
+
+def _init(snap_dir):
+    """各プロセスの準備（一時ストアと保存分の場所）"""
+    item_store.configure(path=":memory:", new_only=False)
+    snapshots.configure(snap_dir)
+
+
+def replay_day(name: str, day: str, snap_dir: str = None):
+    """基準日 day の終わりまでの保存分で name を実行し (Item.dump() のリスト, 途中までか)"""
+    import fetcher
+    _init(snap_dir)
+    today = jst_today(parse_date(day))
+    snapshots.replay(today + timedelta(days=1))
+    fetcher.new_run()       # 別の基準日の応答を使い回さない
+    budget = scheduler.Budget(name=name)
+    try:
+        items = scheduler.call(budget, load(name).collect, today)
+        missed = snapshots.missed
+    finally:
+        snapshots.replay(None)
+    return [it.dump() for it in items], budget.truncated or missed > 0
+
+
+def days(start, end):
+    out, d = [], start
+    while d <= end:
+        out.append(f"{d:%Y-%m-%d}")
+        d += timedelta(days=1)
+    return out
+
+
+def build_parser():
+    ap = argparse.ArgumentParser(description="保存済みの取得結果に現在の判定をかけ直す（通信なし）")
+    ap.add_argument("--from", dest="start", type=parse_date, required=True,
+                    help="開始日 YYYY-MM-DD")
+    ap.add_argument("--to", dest="end", type=parse_date, required=True,
+                    help="終了日 YYYY-MM-DD（この日を含む）")
+    ap.add_argument("--sources", type=parse_sources, default=list(ORDER),
+                    help="対象セクションをカンマ区切りで指定")
+    ap.add_argument("-o", "--output", default="reprocess.md",
+                    help="Markdown の出力先（- で標準出力）")
+    ap.add_argument("--jsonl", help="JSON Lines の出力先")
+    ap.add_argument("--snapshots", help="保存先（既定: $IT_MONITOR_SNAPSHOTS または state/snapshots）")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                    help="並行するプロセス数（既定: CPU 数、1 でこのプロセス内）")
+    return ap
+
+
+def main(argv=None):
+    ap = build_parser()
+    args = ap.parse_args(argv)
+    if args.start > args.end:
+        ap.error("--from must not be after --to")
+    if args.snapshots and not os.path.isdir(args.snapshots):
+        ap.error(f"no such directory: {args.snapshots}")
+
+    _init(args.snapshots)
+    names = args.sources
+    jobs = [(name, day) for name in names for day in days(args.start, args.end)]
+    found = {name: [] for name in names}
+    failed = {name: 0 for name in names}
+
+    def collected(name, day, result):
+        try:
+            dumps, truncated = result()
+        except Exception as exc:
+            failed[name] += 1
+            print(f"[WARN] {name} {day}: {type(exc).__name__}: {exc}", file=sys.stderr)
+            return
+        if truncated:
+            failed[name] += 1
+            print(f"[WARN] {name} {day}: partial (missing snapshots)", file=sys.stderr)
+        found[name].extend(Item.load(name, d) for d in dumps)
+
+    if args.workers <= 1:
+        for name, day in jobs:
+            collected(name, day, lambda: replay_day(name, day, args.snapshots))
+    else:
+        # 子プロセスは自分で解析するので、さらに parsepool の子を作らせない
+        os.environ["IT_MONITOR_PARSE_WORKERS"] = "0"
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        with ProcessPoolExecutor(max_workers=args.workers, mp_context=ctx,
+                                 initializer=_init, initargs=(args.snapshots,)) as pool:
+            futures = {pool.submit(replay_day, name, day, args.snapshots): (name, day)
+                       for name, day in jobs}
+            for fut in as_completed(futures):
+                collected(*futures[fut], fut.result)
+
+    total = len(days(args.start, args.end))
+    with ReportWriter(names, args.output, args.jsonl, index=CrossIndex(),
+                      titles={name: load(name).TITLE for name in names}) as writer:
+        for name in names:
+            mod = load(name)
+            items = finish(found[name], getattr(mod, "NEWEST_FIRST", False))
+            note = (f"※ {total} 日のうち {failed[name]} 日は保存分が足りないため"
+                    "途中までの結果です\n\n") if failed[name] else ""
+
+            def md(items, mod=mod, note=note):
+                body = mod.render(items, args.end) if items else empty_section(mod, args.start, args.end)
+                return body + note
+            writer.submit(name, items, md, partial=bool(failed[name]))
+
+
+if __name__ == "__main__":
+    main()
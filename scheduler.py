@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+scheduler.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  実行全体の締め切りと、セクションごとの持ち時間 (Budget) を管理する。
+  ・各セクションは専用スレッドで動き、scheduler.current() で自分の Budget を得る
+  ・通信のタイムアウトは budget.timeout() で残り時間以下に切り詰める
+  ・ループの先頭で budget.stop() を見て、時間切れならそこまでの結果で打ち切る
+    （打ち切った場合は truncated が立ち、レポートに「途中まで」と明記される）
+  ・接続先の遮断など時間以外の理由で取りこぼしたときは budget.partial() で同様に記録
+  ・全体締め切り + 猶予を過ぎても戻らないセクションは待たずに見捨てる
+    （スレッドは daemon なのでプロセス終了を妨げない）
+"""
+
+import queue
+import threading
+import time
+
+_local = threading.local()
+
+GRACE_SEC = 10      # 持ち時間を使い切ってから戻ってくるまでの猶予
+
+
+class Budget:
+    """締め切り付きの持ち時間。seconds=None なら無制限。name は実行中のセクション名"""
+
+    def __init__(self, seconds: float = None, deadline: float = None, name: str = None):
+        ends = [t for t in (deadline,
+                            time.monotonic() + seconds if seconds is not None else None)
+                if t is not None]
+        self.deadline  = min(ends) if ends else None
+        self.truncated = False
+        self.name      = name
+
+    def remaining(self):
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def expired(self) -> bool:
+        r = self.remaining()
+        return r is not None and r <= 0
+
+    def partial(self) -> None:
+        """時間以外の理由（接続先の遮断など）で取りこぼしたことを記録"""
+        self.truncated = True
+
+    def stop(self) -> bool:
+        """時間切れなら打ち切りを記録して True（ループの先頭で呼ぶ）"""
+        if self.expired():
+            self.truncated = True
+            return True
+        return False
+
+    def timeout(self, default):
+        """requests 用タイムアウト。残り時間より長くならないように切り詰める
+        （(connect, read) のタプルも可）"""
+        r = self.remaining()
+        if r is None:
+            return default
+        cap = lambda t: max(0.1, min(t, r))
+        return tuple(cap(t) for t in default) if isinstance(default, tuple) else cap(default)
+
+    def timeout_ms(self, default_ms: int) -> int:
+        """playwright 用（ミリ秒）"""
+        return int(self.timeout(default_ms / 1000) * 1000)
+
+
+UNLIMITED = Budget()
+
+
+def current() -> Budget:
+    """実行中のセクションの Budget（単体実行時は無制限）"""
+    return getattr(_local, "budget", UNLIMITED)
+
+
+def call(budget: Budget, fn, *args):
+    """現在のスレッドで budget を持ち時間として fn(*args) を実行する"""
+    prev = getattr(_local, "budget", None)
+    _local.budget = budget
+    try:
+        return fn(*args)
+    finally:
+        _local.budget = prev if prev is not None else UNLIMITED
+
+
+def run_all(tasks, deadline_sec: float = None, budgets=None, on_done=None):
+    """tasks = {名前: 引数なし関数}。各関数を Budget 付きのスレッドで並行実行し、
+    終わった順に on_done(name, result, exc, budget) を呼ぶ。
+    全体締め切り + 猶予までに戻らなかったものは exc=TimeoutError で通知する"""
+    budgets = budgets or {}
+    run_deadline = time.monotonic() + deadline_sec if deadline_sec else None
+    done = queue.Queue()
+
+    def worker(name, fn, budget):
+        try:
+            done.put((name, call(budget, fn), None, budget))
+        except BaseException as e:
+            done.put((name, None, e, budget))
+
+    running = {}
+    for name, fn in tasks.items():
+        budget = Budget(budgets.get(name), run_deadline, name)
+        running[name] = budget
+        threading.Thread(target=worker, args=(name, fn, budget),
+                         name=f"section-{name}", daemon=True).start()
+
+    hard_stop = run_deadline + GRACE_SEC if run_deadline else None
+    while running:
+        wait = None if hard_stop is None else max(0, hard_stop - time.monotonic())
+        try:
+            name, result, exc, budget = done.get(timeout=wait)
+        except queue.Empty:
+            break
+        running.pop(name, None)
+        if on_done:
+            on_done(name, result, exc, budget)
+
+    # 締め切りを過ぎても戻らないセクション
+    for name, budget in running.items():
+        budget.truncated = True
+        if on_done:
+            on_done(name, None, TimeoutError("run deadline exceeded"), budget)
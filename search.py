@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+search.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  項目ストアに記録した過去の項目を全文検索する（result.md の履歴を grep する代わり）。
+  ・語は NFKC + 小文字化して部分一致（全角・半角、大文字・小文字を区別しない）
+  ・複数の語はどれかを含むもの、--all で全部を含むもの
+  ・新しい順に出す。索引は各実行が新しい項目の分だけ足していく（item_store.py）
+  ・ストアは読み取り専用で開く（実行回を記録しない。ファイルが無ければエラー）。
+    --reindex のときだけ書き込み可で開く（このときも無いファイルは作らず、実行回も記録しない）
+
+使い方:
+    python search.py サイバー 光ファイバ --sources soumu,nisc
+    python search.py 生成AI --since 2025-01-01 --limit 10
+    python search.py デジタル 人材 --all --db state/items.sqlite3
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+import item_store
+from item_store import open_store
+
+
+def build_parser():
+    ap = argparse.ArgumentParser(description="記録済みの項目を全文検索する")
+    ap.add_argument("terms", nargs="+", help="検索語（複数ならどれかを含むもの）")
+    ap.add_argument("--all", dest="every", action="store_true",
+                    help="すべての語を含むものだけ")
+    ap.add_argument("--sources", type=lambda s: [n.strip() for n in s.split(",") if n.strip()],
+                    help="セクションをカンマ区切りで絞る（例: soumu,nisc）")
+    ap.add_argument("--since", help="この日以降 YYYY-MM-DD")
+    ap.add_argument("--until", help="この日以前 YYYY-MM-DD")
+    ap.add_argument("--limit", type=int, default=50, help="表示件数（既定 50）")
+    ap.add_argument("--db", help="項目ストアの SQLite パス（既定: $IT_MONITOR_DB または state/items.sqlite3）")
+    ap.add_argument("--reindex", action="store_true",
+                    help="索引に無い項目を足してから検索（索引を作る前の項目用）")
+    return ap
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    path = args.db or os.environ.get("IT_MONITOR_DB", item_store.DEFAULT_DB)
+    if not os.path.isfile(path):     # --reindex でも、無いストアは作らない
+        sys.exit(f"[ERROR] item store not found: {path}")
+    item_store.configure(path=path, readonly=not args.reindex, start_run=False)
+    try:
+        store = open_store()
+    except sqlite3.Error as e:
+        sys.exit(f"[ERROR] {path}: {e}")
+    if args.reindex:
+        print(f"[search] indexed {store.reindex()} item(s)", file=sys.stderr)
+
+    t0 = time.perf_counter()
+    try:
+        rows = store.search(args.terms, args.sources, args.since, args.until,
+                            every=args.every, limit=args.limit)
+    except RuntimeError as e:
+        sys.exit(f"[ERROR] {e}")
+    ms = (time.perf_counter() - t0) * 1000
+
+    for source, date, title, url in rows:
+        print(f"{date}  {source:8s} {title}")
+        if url:
+            print(f"{'':20s}{url}")
+    print(f"[search] {len(rows)} hit(s) in {ms:.1f} ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+snapshots.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  全セクションの取得結果（生の応答本文）を圧縮して保存し、あとから通信なしで
+  同じ取得を再現できるようにする（reprocess.py で使う）。
+  ・本文は SHA-256 をキーに 1 回だけ保存する（内容アドレス）。毎日同じ内容を返す
+    ページは何度取得しても実体は 1 つで、索引の最終確認時刻だけが進む
+  ・圧縮は zstandard が入っていれば zstd、無ければ gzip（読むときは拡張子で判別）
+  ・索引は (ソース, 正規化 URL, 状態コード, Content-Type, エンコーディング, 本文の
+    ハッシュ, 初出, 最終確認)。同じ URL の内容が変わるたびに 1 行増える
+  ・保持期限: RETAIN_DAYS 日より前の行は捨てる（ただし URL ごとの最新の 1 行は残す。
+    一度しか取らない詳細ページも再現できるように）。実体の合計が MAX_MB を
+    超えたら古い行から捨て、どの行からも参照されない実体を消す
+  ・記録するのは fetcher.get の応答（5xx と 304 を除く）、フィードの読んだ分、
+    browser.render の描画後の HTML
+  ・replay(until) の間は記録をやめ、fetcher / browser は until より前に取得した
+    最新の本文を返す（無ければ requests.ConnectionError）
+
+保存先は環境変数 IT_MONITOR_SNAPSHOTS（既定: state/snapshots、0 で保存しない）。
+
+使い方:
+    python snapshots.py                    # 件数と容量
+    python snapshots.py --prune --days 30  # 保持期限を縮めて掃除
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+
+JST = timezone(timedelta(hours=9))
+DEFAULT_DIR = os.path.join("state", "snapshots")
+
+RETAIN_DAYS = 90
+MAX_MB      = 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    sha      TEXT PRIMARY KEY,
+    codec    TEXT NOT NULL,
+    size     INTEGER NOT NULL,
+    stored   INTEGER NOT NULL,
+    created  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    source        TEXT NOT NULL,
+    url           TEXT NOT NULL,
+    final_url     TEXT,
+    status        INTEGER NOT NULL,
+    content_type  TEXT,
+    encoding      TEXT,
+    sha           TEXT NOT NULL,
+    first_seen    TEXT NOT NULL,
+    last_seen     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_url ON snapshots (url, first_seen);
+CREATE INDEX IF NOT EXISTS snapshots_sha ON snapshots (sha);
+"""
+
+
+# ───────── 圧縮
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+def compress(data: bytes):
+    """(圧縮後のバイト列, 拡張子)"""
+    if zstd := _zstd():
+        return zstd.ZstdCompressor(level=10).compress(data), "zst"
+    return gzip.compress(data, compresslevel=6), "gz"
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zst":
+        import zstandard
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def _now() -> str:
+    return datetime.now(JST).isoformat(timespec="seconds")
+
+
+class SnapshotStore:
+    def __init__(self, root: str = DEFAULT_DIR):
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self.root = root
+        self.lock = threading.RLock()
+        self.db = sqlite3.connect(os.path.join(root, "index.sqlite3"),
+                                  check_same_thread=False, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def _path(self, sha: str, codec: str) -> str:
+        return os.path.join(self.root, "objects", sha[:2], f"{sha}.{codec}")
+
+    # ───────── 書く
+    def put(self, source: str, url: str, content: bytes, status: int = 200,
+            content_type: str = None, encoding: str = None, final_url: str = None) -> str:
+        """本文を保存して索引に記録し、ハッシュを返す"""
+        from item_store import canonical_url
+        sha = hashlib.sha256(content).hexdigest()
+        key, now = canonical_url(url), _now()
+        with self.lock:
+            last = self.db.execute(
+                "SELECT id, sha, status FROM snapshots WHERE url=? "
+                "ORDER BY first_seen DESC, id DESC LIMIT 1", (key,)).fetchone()
+            if last and last[1:] == (sha, status):
+                with self.db:
+                    self.db.execute("UPDATE snapshots SET last_seen=? WHERE id=?",
+                                    (now, last[0]))
+                return sha
+            if not self.db.execute("SELECT 1 FROM objects WHERE sha=?", (sha,)).fetchone():
+                data, codec = compress(content)
+                path = self._path(sha, codec)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = f"{path}.tmp{os.getpid()}"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+                with self.db:
+                    self.db.execute("INSERT INTO objects VALUES (?,?,?,?,?)",
+                                    (sha, codec, len(content), len(data), now))
+            with self.db:
+                self.db.execute(
+                    "INSERT INTO snapshots (source, url, final_url, status, content_type, "
+                    "encoding, sha, first_seen, last_seen) VALUES (?,?,?,?,?,?,?,?,?)",
+                    (source, key, final_url if final_url != url else None, status,
+                     content_type, encoding, sha, now, now))
+        return sha
+
+    # ───────── 読む
+    def latest(self, url: str, until: datetime = None):
+        """until より前に初めて取得した、url の最新の索引行（dict）"""
+        from item_store import canonical_url
+        sql = ("SELECT url, final_url, status, content_type, encoding, sha, first_seen "
+               "FROM snapshots WHERE url=?")
+        args = [canonical_url(url)]
+        if until is not None:
+            sql += " AND first_seen < ?"
+            args.append(until.astimezone(JST).isoformat(timespec="seconds"))
+        with self.lock:
+            row = self.db.execute(sql + " ORDER BY first_seen DESC, id DESC LIMIT 1",
+                                  args).fetchone()
+        if row is None:
+            return None
+        keys = ("url", "final_url", "status", "content_type", "encoding", "sha", "first_seen")
+        return dict(zip(keys, row))
+
+    def body(self, sha: str) -> bytes:
+        with self.lock:
+            codec, = self.db.execute("SELECT codec FROM objects WHERE sha=?", (sha,)).fetchone()
+        with open(self._path(sha, codec), "rb") as f:
+            return decompress(f.read(), codec)
+
+    # ───────── 保持期限
+    def prune(self, days: float = RETAIN_DAYS, max_mb: float = MAX_MB) -> int:
+        """期限切れの行と参照されない実体を消し、消した実体の数を返す"""
+        cutoff = (datetime.now(JST) - timedelta(days=days)).isoformat(timespec="seconds")
+        with self.lock, self.db:
+            self.db.execute(
+                "DELETE FROM snapshots WHERE last_seen < ? AND id NOT IN "
+                "(SELECT MAX(id) FROM snapshots GROUP BY url)", (cutoff,))
+            total = self.db.execute("SELECT COALESCE(SUM(stored), 0) FROM objects").fetchone()[0]
+            limit = max_mb * 1024 * 1024
+            if total > limit:
+                # 古い行から順に、どの実体も使わなくなるまで捨てる
+                rows = self.db.execute(
+                    "SELECT s.id, s.sha, o.stored FROM snapshots s JOIN objects o USING (sha) "
+                    "ORDER BY s.last_seen").fetchall()
+                refs = {}
+                for _, sha, _ in rows:
+                    refs[sha] = refs.get(sha, 0) + 1
+                drop = []
+                for rid, sha, stored in rows:
+                    if total <= limit:
+                        break
+                    drop.append((rid,))
+                    refs[sha] -= 1
+                    if refs[sha] == 0:
+                        total -= stored
+                self.db.executemany("DELETE FROM snapshots WHERE id=?", drop)
+            orphans = self.db.execute(
+                "SELECT sha, codec FROM objects WHERE sha NOT IN "
+                "(SELECT DISTINCT sha FROM snapshots)").fetchall()
+            self.db.executemany("DELETE FROM objects WHERE sha=?", [(s,) for s, _ in orphans])
+        for sha, codec in orphans:
+            try:
+                os.remove(self._path(sha, codec))
+            except FileNotFoundError:
+                pass
+        return len(orphans)
+
+    def stats(self) -> dict:
+        with self.lock:
+            rows, urls = self.db.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT url) FROM snapshots").fetchone()
+            objects, size, stored = self.db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored), 0) "
+                "FROM objects").fetchone()
+            fetched = self.db.execute(
+                "SELECT COALESCE(SUM(o.size), 0) FROM snapshots s JOIN objects o USING (sha)"
+                ).fetchone()[0]
+        return {"snapshots": rows, "urls": urls, "objects": objects,
+                "bytes": size, "stored": stored, "referenced": fetched}
+
+    def close(self) -> None:
+        with self.lock:
+            self.db.close()
+
+
+_STORE = None
+_STORE_LOCK = threading.Lock()
+_CONFIG = {}
+_replay = None          # replay 中は until（datetime）
+missed  = 0             # replay 中に保存分が無かった取得の数
+
+def configure(path: str = None) -> None:
+    """open_store() より前に呼び、環境変数より優先する保存先を与える（CLI 用）"""
+    global _STORE
+    with _STORE_LOCK:
+        if path is not None and path != _CONFIG.get("path"):
+            _CONFIG["path"] = path
+            _STORE = None
+
+def open_store():
+    """プロセス内で共有するストア（保存しない設定なら None）"""
+    global _STORE
+    path = _CONFIG.get("path") or os.environ.get("IT_MONITOR_SNAPSHOTS", DEFAULT_DIR)
+    if path in ("0", "off"):
+        return None
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = SnapshotStore(path)
+    return _STORE
+
+
+def record(url: str, content, status: int = 200, content_type: str = None,
+           encoding: str = None, final_url: str = None) -> None:
+    """取得した本文を記録する（replay 中・保存しない設定では何もしない）。
+    ソース名は scheduler の Budget から取る"""
+    if _replay is not None or content is None or (store := open_store()) is None:
+        return
+    import scheduler
+    if isinstance(content, str):
+        content, encoding = content.encode("utf-8"), "utf-8"
+    try:
+        store.put(scheduler.current().name or "", url, content, status,
+                  content_type, encoding, final_url)
+    except (OSError, sqlite3.Error) as e:
+        # 保存できなくても取得そのものは続ける
+        print(f"[WARN] snapshot {url}: {e}", file=sys.stderr)
+
+
+def record_response(resp) -> None:
+    """requests.Response 版（5xx / 304 は残さない）"""
+    if _replay is not None or resp.status_code >= 500 or resp.status_code == 304:
+        return
+    url = resp.history[0].url if resp.history else resp.request.url
+    record(url, resp.content, resp.status_code, resp.headers.get("Content-Type"),
+           resp.encoding, resp.url)
+
+
+# ───────── 再現
+def replay(until: datetime = None) -> None:
+    """until より前の保存分で取得を再現する（None で通常に戻す）"""
+    global _replay, missed
+    _replay, missed = until, 0
+
+def replaying() -> bool:
+    return _replay is not None
+
+def replayed(url: str):
+    """保存分から組み立てた requests.Response（無ければ ConnectionError）"""
+    global missed
+    import requests
+    store = open_store()
+    snap = store.latest(url, _replay) if store is not None else None
+    if snap is None:
+        missed += 1
+        raise requests.ConnectionError(f"no snapshot before {_replay:%Y-%m-%d %H:%M}: {url}")
+    resp = requests.Response()
+    resp.status_code = snap["status"]
+    resp.reason = ""
+    resp.url = snap["final_url"] or url
+    resp.encoding = snap["encoding"]
+    if snap["content_type"]:
+        resp.headers["Content-Type"] = snap["content_type"]
+    resp._content = store.body(snap["sha"])
+    resp._content_consumed = True      # iter_content() は _content を切って返す
+    return resp
+
+
+def prune(days: float = RETAIN_DAYS, max_mb: float = MAX_MB) -> None:
+    """保存する設定なら保持期限を過ぎた分を消す（実行の最後に呼ぶ）"""
+    if _replay is None and (store := open_store()) is not None:
+        store.prune(days, max_mb)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="取得結果の保存分の件数・容量と掃除")
+    ap.add_argument("--dir", help="保存先（既定: $IT_MONITOR_SNAPSHOTS または state/snapshots）")
+    ap.add_argument("--prune", action="store_true", help="保持期限を過ぎた分を消す")
+    ap.add_argument("--days", type=float, default=RETAIN_DAYS,
+                    help=f"保持日数（既定 {RETAIN_DAYS}）")
+    ap.add_argument("--max-mb", type=float, default=MAX_MB,
+                    help=f"実体の合計の上限 MB（既定 {MAX_MB}）")
+    args = ap.parse_args(argv)
+    configure(args.dir)
+    store = open_store()
+    if store is None:
+        ap.error("snapshots are disabled (IT_MONITOR_SNAPSHOTS=0)")
+    if args.prune:
+        print(f"removed {store.prune(args.days, args.max_mb)} object(s)")
+    s = store.stats()
+    ratio = s["referenced"] / s["stored"] if s["stored"] else 0
+    print(f"{s['snapshots']} snapshots of {s['urls']} URLs, {s['objects']} objects; "
+          f"{s['bytes'] / 1e6:.1f} MB raw, {s['stored'] / 1e6:.1f} MB stored "
+          f"({ratio:.1f}x incl. dedup)")
+
+
+if __name__ == "__main__":
+    main()
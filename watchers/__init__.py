@@ -0,0 +1,50 @@
+"""
+watchers  ―  各省庁・政党サイトの巡回モジュール
+
+各モジュールは共通して
+  TITLE                : レポートの見出し
+  collect(today)       : 基準日 today (JST 0時) の窓で項目 (item.Item) のリストを返す
+  render(items, today) : 項目から Markdown のセクション文字列を作る
+を持ち、単体でも `python -m watchers.<name>` で実行できる。
+項目は item.Item で、並べ替え・重複排除・ストアへの記録は finish() で
+全セクション共通に 1 回だけ行う（新しい順にしたいセクションは NEWEST_FIRST = True）。
+requests / bs4 / playwright などの重い依存は collect() の中で読み込むので、
+モジュールの import 自体は軽い。
+feeds.toml に書いたフィードも同じ顔のセクション (feeds.FeedSection) として
+ORDER の末尾に加わる。セクションは名前から load() で取り出す。
+"""
+
+import importlib
+from datetime import datetime, timedelta, timezone
+
+import feeds
+
+# レポートに出す順
+MODULES = ["speech", "ldp", "digital", "soumu", "meti", "cao", "nisc", "fsa", "news"]
+FEEDS   = {name: s for name, s in feeds.sections().items() if name not in MODULES}
+ORDER   = MODULES + list(FEEDS)
+
+JST = timezone(timedelta(hours=9))
+
+
+def load(name: str):
+    """セクション名 → モジュール（または設定のフィード）"""
+    if name in FEEDS:
+        return FEEDS[name]
+    return importlib.import_module(f"watchers.{name}")
+
+
+def finish(items, newest_first: bool = False):
+    """collect() の結果を日付順に並べて重複を除き、ストアに記録して出す分だけ返す"""
+    from item import unique
+    from item_store import open_store
+    store = open_store()
+    return [it for it in unique(items, newest_first) if store.keep_item(it)]
+
+
+def jst_today(today=None) -> datetime:
+    """実行基準日（JST の 0 時）。省略時は現在日付"""
+    today = today or datetime.now(JST)
+    if today.tzinfo is None:
+        today = today.replace(tzinfo=JST)
+    return today.astimezone(JST).replace(hour=0, minute=0, second=0, microsecond=0)
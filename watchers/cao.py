@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+cao_press_watcher_rss_etree.py  rev-1.6  (2025-06-19)
+
+■ 内閣府「報道発表新着情報」RSSフィードを標準ライブラリだけで取得・解析し、
+  過去 4 日間に掲載された “DX／デジタル関連＋食品・環境” の
+  リリースを抽出して一覧表示します。
+
+・取得・解析・日付変換は feeds.py（条件付き GET、古い項目に達したら打ち切り）
+依存:
+    pip install requests
+"""
+
+from datetime import datetime, timedelta, timezone
+import feeds
+from document import Matcher
+from watchers import finish, jst_today
+# requests は取得時に読み込む
+
+# ───────── Settings ──────────────────────────────────────
+RSS_URL       = "https://www.cao.go.jp/rss/news.rdf"
+LOOKBACK_DAYS = 4
+BUDGET        = 45      # 秒（scheduler の持ち時間）
+POLL_SEC      = 600     # 秒（常駐モードの巡回間隔の初期値。RSS は条件付き GET なので短め）
+
+# ───────── Date window ───────────────────────────────────
+JST      = timezone(timedelta(hours=9))
+
+# ───────── Keywords ─────────────────────────────────────
+KEYWORDS = [
+    "環境",
+    "DX", "デジタル", "クラウド", "ガバメントクラウド", "データセンター",
+    "経済安全保障", "QUAD", "サプライチェーン", "セキュリティクリアランス",
+    "電気通信事業法", "サイバーセキュリティ", "Web3", "半導体", "AI",
+    "GIGAスクール構想", "量子コンピューター", "スーパーコンピュータ",
+    "スマホ新法", "青少年インターネット環境整備法", "Fintech",
+    "中央銀行デジタル通貨", "知的財産", "個人情報保護", "医療DX",
+    "新年度予算（デジタル関連）"
+]
+# キーワードは 1 回だけ正規化して 1 本の正規表現にまとめる
+kw_hit = Matcher(KEYWORDS)
+
+# ───────── Fetch, parse and filter ──────────────────────
+def scrape_cao_rss(today: datetime):
+    """RDF を feeds で読み、窓内でキーワードに合うものを返す"""
+    win_from = today - timedelta(days=LOOKBACK_DAYS)
+    win_to   = today + timedelta(days=1)
+    return [e.item('cao')
+            for e in feeds.read(RSS_URL, win_from, timeout=(10, 30))
+            if e.dt < win_to and kw_hit(e.title)]
+
+# ───────── CLI ─────────────────────────────────────────
+TITLE = "【内閣府】"
+
+NEWEST_FIRST = True     # 新しい順に並べる
+
+def collect(today=None):
+    return scrape_cao_rss(jst_today(today))
+
+def render(recs, today=None) -> str:
+    out = [TITLE]
+    if not recs:
+        out.append("DXやデジタル化に関連する新着情報および審議会等の開催はいずれもなし\n")
+    for r in recs:
+        out.append(f"○{r.label()}　{r.title}\n")
+        out.append(f"　{r.url}\n")
+    return "\n".join(out) + "\n"
+
+def main():
+    print(render(finish(collect(), NEWEST_FIRST)), end="")
+
+if __name__ == "__main__":
+    main()
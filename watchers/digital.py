@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+digital_watcher.py  rev-4.6-DIGITAL  (2025-06-23)
+
+■ 役割
+  デジタル庁サイトの「プレスリリース」「ニュース」から、
+  デジタル政策関連キーワードを含み、かつ一定期間 (LOOKBACK/AHEAD) 内に発信
+  された記事を抽出して一覧表示する。
+"""
+import re
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin
+import jpdate
+from document import Matcher
+import parsepool
+import scheduler
+from item import Item
+from item_store import open_store
+from watchers import finish, jst_today
+# fetcher(requests) / bs4 は使う関数の中で読み込む
+
+# ───────── 基本設定
+UA = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+      "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125 Safari/537.36")
+JST   = timezone(timedelta(hours=9))
+
+LOOKBACK = 5      # 今日 + 過去4日
+AHEAD    = 7      # 未来 (開催案内など)
+DIG_PAGES = 15    # 各カテゴリで深掘りするページ数
+BACKFILL_PAGES = 300  # 過去分の取得時に深掘りする上限
+WAIT      = 0.3   # 秒
+BUDGET    = 180   # 秒（scheduler の持ち時間）
+POLL_SEC  = 1800  # 秒（常駐モードの巡回間隔の初期値）
+
+# ───────── キーワード定義
+RAW_KW = [
+    # 技術・行政一般
+    "デジタル","情報通信","サイバー","AI","DX","ＤＸ","IT","SNS",
+    "標準仕様","ガイドライン","無線局","免許状","光ファイバ",
+]
+# NFKC + 小文字化して 1 本の正規表現で判定（2 文字の英字は単語境界つき）
+kw_hit = Matcher(RAW_KW)
+
+# ───────── 日付判定
+def window(today: datetime):
+    """基準日 today に対する掲載期間の判定関数"""
+    win_from = today - timedelta(days=LOOKBACK - 1)
+    win_to   = today + timedelta(days=AHEAD)
+    return lambda d: win_from <= d <= win_to
+
+DIG_ROOT = ["https://www.digital.go.jp/press", "https://www.digital.go.jp/news"]
+def article_date(html: str):
+    """記事詳細 HTML から <time datetime> または見出し付近の「YYYY年M月D日」を取得
+    （DOM は組み立てず、見つからなければ本文全体を走査）"""
+    return jpdate.find_date_html(html, ("ymd",))
+
+def parse_listing(content: bytes, encoding: str, url: str):
+    """一覧ページの記事リンクを (リンク文字列, 絶対URL) で返す（parsepool の子プロセスで実行）"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, "html.parser", from_encoding=encoding)
+    return [(a.get_text(" ", strip=True), urljoin(url, a["href"]))
+            for a in soup.select("a[href^='/press/'], a[href^='/news/']")]
+
+def scrape_digital(in_window, pages: int = DIG_PAGES, until: datetime = None):
+    """in_window(日付) を満たす記事を集める。
+    until を与えると、ヒットの無いページでも一覧の日付が until より古くなるまで読み進める"""
+    import requests
+    import fetcher
+
+    # 接続は fetcher の共有 Session で持ち越す（常駐モードの巡回をまたいでも温かいまま）
+    headers = {"User-Agent": UA}
+    hits, seen = [], set()
+    budget = scheduler.current()
+
+    for root in DIG_ROOT:
+        for pg in range(1, pages + 1):
+            if budget.stop():
+                break
+            url = root if pg == 1 else f"{root}?page={pg}"
+            try:
+                resp = fetcher.get(url, headers=headers, timeout=20)
+            except fetcher.CircuitOpen:
+                budget.partial()    # ホスト遮断中は取得済みの分で打ち切り
+                break
+            except requests.RequestException as e:
+                budget.partial()    # 取得済みの分を残して打ち切り
+                print(f"[WARN] digital {url}: {e}", file=sys.stderr)
+                break
+            page_has_hit = False
+            oldest = None       # 一覧に載っている最も古い日付
+
+            for title, link in parsepool.run_memo("digital", url, None, parse_listing,
+                                                  resp.content, resp.encoding, url):
+                if (d := jpdate.find_date(title, ("ymd",))) and (oldest is None or d < oldest):
+                    oldest = d
+                # 末尾の「分類 ＋ YYYY年M月D日」を削除
+                title = re.sub(r'\s+\S+\s+\d{4}年\d{1,2}月\d{1,2}日$', '', title)
+
+                if not title or not kw_hit(title):
+                    continue
+
+                if link in seen:
+                    continue
+                if budget.stop():
+                    break
+
+                # 記事ページを取得して日付を判定（取得済みならストアの日付を使う）
+                if cached := open_store().detail("digital", link):
+                    dt = datetime.fromisoformat(cached["date"])
+                else:
+                    try:
+                        # 1 本の遅い記事で止まらないようヘッジ付きで取得
+                        art_html = fetcher.get(link, headers=headers, timeout=20, hedge=True).text
+                    except fetcher.CircuitOpen:
+                        budget.partial()
+                        break
+                    except requests.RequestException as e:
+                        budget.partial()
+                        print(f"[WARN] digital {link}: {e}", file=sys.stderr)
+                        break
+                    dt = article_date(art_html)
+                    if dt:
+                        open_store().put_detail("digital", link, {"date": dt.isoformat()})
+                if not dt or not in_window(dt):
+                    continue
+
+                hits.append(Item("digital", dt, title, link))
+                seen.add(link)
+                page_has_hit = True
+
+            if budget.truncated:
+                break
+            if until is None:
+                # ヒットが無いページでループ終了
+                if not page_has_hit:
+                    break
+            elif oldest is None or oldest < until:
+                # 過去分: 一覧が until より前に達したら（または最終ページで）終了
+                break
+
+            time.sleep(WAIT)
+
+    return hits
+
+TITLE = "【デジタル庁】"
+
+def collect(today=None):
+    return scrape_digital(window(jst_today(today)))
+
+# ───────── 過去分の取得（backfill.py から呼ばれる）
+BACKFILL_CHUNK_DAYS = None  # 一覧は新しい順の 1 本道なので期間全体で 1 チャンク
+BACKFILL_WORKERS    = 1
+
+def backfill(start: datetime, end: datetime):
+    """start〜end（両端含む）の記事を一覧の奥まで辿って集める"""
+    end_excl = end + timedelta(days=1)
+    return scrape_digital(lambda d: start <= d < end_excl, BACKFILL_PAGES, until=start)
+
+def render(results, today=None) -> str:
+    #print(f"===== Digital庁 Policy Watch ({TODAY:%-m/%-d}) =====\n")
+    out = [TITLE]
+    if not results:
+        out.append("DXやデジタル化に関連する新着情報および審議会等の開催はいずれもなし\n")
+    for r in results:
+        out.append(f"⚪︎{r.label()}　{r.title}\n{r.url}\n")
+    return "\n".join(out) + "\n"
+
+def main():
+    print(render(finish(collect())), end="")
+
+if __name__ == "__main__":
+    main()
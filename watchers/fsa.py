@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+from datetime import datetime, timedelta
+import jpdate
+from document import Document, Matcher
+import parsepool
+import scheduler
+from item import Item
+from item_store import open_store
+from watchers import finish, jst_today
+
+BASE_URL = 'https://www.fsa.go.jp'
+# 抽出対象とするキーワード（人事・人事異動も追加）
+KEYWORDS = [
+    "デジタル", "情報通信", "サイバー", "AI", "DX", "ＤＸ", "IT", "SNS",
+    "標準仕様", "ガイドライン", "無線局", "免許状", "光ファイバ",
+    "人事", "人事異動"
+]
+MATCHER = Matcher(KEYWORDS)
+
+# ───────── 解析（parsepool の子プロセスで実行）
+def parse_page(content: bytes, encoding: str):
+    """日付ページから (キーワード一致, タイトル, 公開日) を返す"""
+    # テキスト化・正規化は Document が 1 回だけ行い、以下の判定で使い回す
+    doc = Document(content, encoding)
+
+    # 公開日（令和表記）を <time>・見出し付近 → 本文の順にパース
+    dt_pub = doc.date(('era',), tz=None)
+
+    # タイトル取得
+    title = doc.first('title', 'h1', 'h2') or '[タイトル不明]'
+
+    # キーワードフィルタ（本文全体）
+    return doc.matches(MATCHER), title, dt_pub
+
+def parse_jinji(content: bytes, encoding: str):
+    """人事異動ページから「令和N年M月D日発令」の (発令日, タイトル) をすべて返す"""
+    doc = Document(content, encoding)
+    if not doc.matches(MATCHER):
+        return []
+    full_text = doc.text
+    out, hr_seen = [], set()
+    for dt_pub, m in jpdate.iter_dates(full_text, ('era',), tz=None):
+        if not full_text.startswith('発令', m.end()) or dt_pub in hr_seen:
+            continue
+        hr_seen.add(dt_pub)
+        out.append((dt_pub, f'人事異動（{jpdate.era_label(dt_pub)}'
+                            f'{dt_pub.month}月{dt_pub.day}日付）について公表しました。'))
+    return out
+
+def fetch_fsa_news(days: int = 4, today=None):
+    import requests
+    import fetcher
+
+    today     = jst_today(today).replace(tzinfo=None)
+    threshold = today - timedelta(days=days)
+    results   = []
+
+    # —— デバッグ出力 ——
+    #print(f'DEBUG: today     = {today.strftime("%Y-%m-%d")}')
+    #print(f'DEBUG: threshold = {threshold.strftime("%Y-%m-%d")}')
+
+    # ① /inter/etc/YYYYMMDD/YYYYMMDD.html のループチェック
+    # 過去分の結果は解析のソース・キーワードの版とともに残し、版が変われば取り直す
+    version = parsepool.memo_version(parse_page, KEYWORDS)
+    budget = scheduler.current()
+    for delta in range((today - threshold).days + 1):
+        if budget.stop():
+            break
+        dt = threshold + timedelta(days=delta)
+        subpath = f'/inter/etc/{dt.strftime("%Y%m%d")}/{dt.strftime("%Y%m%d")}.html'
+        url     = BASE_URL + subpath
+        #print(f'DEBUG: checking URL = {url}')
+
+        # 前日以前のページは取得済みなら結果を再利用
+        if version and (cached := open_store().detail('fsa', url)) and cached.get('version') == version:
+            if cached['hit']:
+                results.append((datetime.fromisoformat(cached['date']), cached['title'], url))
+            continue
+
+        try:
+            resp = fetcher.get(url, timeout=20)
+        except fetcher.CircuitOpen:
+            budget.partial()      # ホスト遮断中なら取得済みの分で打ち切り
+            break
+        except requests.RequestException as e:
+            budget.partial()      # 取得済みの分を残して打ち切り
+            print(f'[WARN] fsa {url}: {e}', file=sys.stderr)
+            break
+        #print(f'DEBUG: status_code = {resp.status_code}')
+        if resp.status_code != 200:
+            continue
+
+        # 解析は別プロセスで行い、結果だけを受け取る
+        matched, title, dt_pub = parsepool.run_memo('fsa', url, KEYWORDS, parse_page,
+                                                     resp.content, resp.encoding)
+        dt_pub = dt_pub or dt
+        #print(f'DEBUG: keyword match = {matched}')
+        if dt.date() < today.date():
+            open_store().put_detail('fsa', url, {'version': version, 'hit': matched, 'date': dt_pub.isoformat(), 'title': title})
+        if not matched:
+            continue
+
+        results.append((dt_pub, title, url))
+
+    # ② 人事異動ページ （キーワードフィルタを適用）
+    j_url = BASE_URL + '/common/about/jinji/index.html'
+    #print(f'DEBUG: checking HR URL = {j_url}')
+    resp = None
+    if not budget.stop():
+        try:
+            resp = fetcher.get(j_url, timeout=20)
+        except fetcher.CircuitOpen:
+            budget.partial()
+        except requests.RequestException as e:
+            budget.partial()
+            print(f'[WARN] fsa {j_url}: {e}', file=sys.stderr)
+    #print(f'DEBUG: status_code = {resp.status_code}')
+    if resp is not None and resp.status_code == 200:
+        # 変わっていなければ前回の抽出結果を使う（このページには ETag が無い）
+        for dt_pub, title in parsepool.run_memo('fsa', j_url, KEYWORDS, parse_jinji,
+                                                resp.content, resp.encoding):
+            in_range = threshold <= dt_pub <= today
+            #print(f'DEBUG: HR dt_pub = {dt_pub.strftime("%Y-%m-%d")}, in_range = {in_range}')
+            if in_range:
+                results.append((dt_pub, title, j_url))
+
+    #print(f'DEBUG: total matched results = {len(results)}\n')
+
+    # 人事異動ページは URL が共通なので (日付, タイトル) で識別
+    return [Item('fsa', dt_pub, title, url, by_url=(url != j_url))
+            for dt_pub, title, url in results]
+
+
+TITLE = '【金融庁】'
+DAYS  = 4
+BUDGET = 60     # 秒（scheduler の持ち時間）
+POLL_SEC = 3600 # 秒（常駐モードの巡回間隔の初期値）
+
+def collect(today=None):
+    return fetch_fsa_news(DAYS, today)
+
+# ───────── 過去分の取得（backfill.py から呼ばれる）
+BACKFILL_CHUNK_DAYS = 7     # 1 チャンク = 1 週間分の日付ページ
+BACKFILL_WORKERS    = 2
+
+def backfill(start, end):
+    """start〜end（両端含む）の日付ページを巡回"""
+    return fetch_fsa_news((end - start).days, end)
+
+def render(results, today=None) -> str:
+    out = [TITLE]
+    if results:
+        for r in results:
+            out.append(f'○{r.label()}　「{r.title}」')
+            out.append(f'　{r.url}\n')
+    else:
+        today     = jst_today(today)
+        threshold = today - timedelta(days=DAYS)
+        out.append(f'{threshold.month}月{threshold.day}日〜{today.month}月{today.day}日　'
+                   'DXやデジタル化に関連する新着情報および審議会等の開催はいずれもなし\n')
+    return '\n'.join(out) + '\n'
+
+def main():
+    print(render(finish(collect())), end='')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ldp_watcher.py  rev‑4.6‑LDP‑r4  (2025‑06‑17)
+
+■ 自民党サイト（/activity）を巡回し，
+   過去 4 日＋当日＋未来 10 日の 15 日分から
+   デジタル政策関連イベントのみ抽出して表示。
+   ─ 重複タイトルは「本文が詳しい方」を優先して 1 行に集約。
+"""
+
+# ───────── Imports ──────────────────────────────────────────
+import re, time, sys
+from datetime import datetime, timezone, timedelta
+from urllib.parse import urljoin
+from document import Matcher
+import parsepool
+import scheduler
+from item import Item
+from watchers import finish, jst_today
+# bs4 / playwright は解析・描画のときに読み込む（ブラウザは browser.py で共有）
+
+# ───────── Global settings ─────────────────────────────────
+LOOKBACK          = 4           # 過去 4 日
+AHEAD             = 10          # 未来 10 日
+WAIT_SEC          = 1
+BUDGET            = 240         # 秒（15 日分 × goto の上限を抑える）
+POLL_SEC          = 3600        # 秒（常駐モードの巡回間隔の初期値）
+DEBUG             = True
+DEBUG_SOU         = True
+UA = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+      "AppleWebKit/537.36 (KHTML, like Gecko) "
+      "Chrome/124.0.0.0 Safari/537.36")
+
+# ───────── キーワード ────────────────────────────────────
+KEYWORDS = [
+    # ── 政治・政策 ──
+    "デジタル社会推進本部","経済安全保障対策本部","経済安全保障推進本部",
+    "情報通信戦略調査会","経済成長戦略本部","知的財産戦略調査会",
+    "競争政策調査会","プラットフォームサービス","特定利用者情報",
+    "web3","web3.0研究会","デジタル社会構想会議","デジタル臨時行政調査会",
+    "デジタル社会推進会議",
+    # ── 技術一般 ──
+    "デジタル","情報通信","サイバー","AI","ＤＸ","DX","IT","5g",
+    # ── 行政関連 ──
+    "標準仕様","ガイドライン","無線局","免許状","光ファイバ",
+    # ── 大臣会見 ──
+    "平デジタル大臣",
+]
+# 見出しは空白の入り方がまちまちなので空白を無視して比べる（2 文字英語は単語境界つき）
+kw_hit = Matcher(KEYWORDS, ignore_space=True)
+
+# ───────── 日付ユーティリティ ─────────────────────────
+JST   = timezone(timedelta(hours=9))
+
+# 過去 LOOKBACK 日 ～ 当日 ～ 未来 AHEAD 日
+def window_dates(today: datetime):
+    return [today - timedelta(days=delta)
+            for delta in range(-AHEAD, LOOKBACK + 1)]
+
+DATE_TAG = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+DATE_TXT = re.compile(r"(\d{4})年\s*0?(\d{1,2})月\s*0?(\d{1,2})日")
+TRAIL_RE = re.compile(r"\s*(?:政策|会議等|法令|採用)?\s*20\d{2}年\d{1,2}月\d{1,2}日$")
+
+dbg  = lambda *m: print(*m, file=sys.stderr, flush=True) if DEBUG else None
+sdbg = lambda *m: print("[SOU]", *m, file=sys.stderr, flush=True) if DEBUG_SOU else None
+
+# ════════════════════════════════════════════════════════════════
+#                         自 民 党
+# ════════════════════════════════════════════════════════════════
+HEAD_TAGS = ("dt", "h1", "h2", "h3", "h4", "li")
+EXCLUDE_LDP = re.compile(r"^記者会見$")      # 除外ワード
+
+def better(record_new, record_old):
+    """どちらを残すか判定（本文がタイトルと同じなら劣る）"""
+    body_n, body_o = record_new.get("body"), record_old.get("body")
+    ttl = record_new.title
+    # 本文が空 or タイトルと同じ → 情報量 0
+    score_n = len(body_n) if body_n and body_n != ttl else 0
+    score_o = len(body_o) if body_o and body_o != ttl else 0
+    return record_new if score_n > score_o else record_old
+
+def parse_day(html: str):
+    """1 日分のページから (タイトル, 本文) を返す（parsepool の子プロセスで実行）"""
+    from bs4 import BeautifulSoup
+    out = []
+    for tag in BeautifulSoup(html, "html.parser").find_all(HEAD_TAGS):
+        ttl = tag.get_text(" ", strip=True)
+        if not ttl or EXCLUDE_LDP.match(ttl):
+            continue
+        if not kw_hit(ttl):
+            continue
+        sib = tag.find_next_sibling() or tag
+        body = sib.get_text(" ", strip=True)
+        if body.startswith("今日の 自民党"):
+            body = ""
+        out.append((ttl, body.replace("Google Calenderに予定を追加", "").strip()))
+        #dbg(" 🔹LDP-HIT", ttl[:60])　<- デバックを見たければここを有効化
+    return out
+
+def scrape_ldp(dates):
+    """dates の各日の /activity?day= ページを巡回する"""
+    import browser
+    import fetcher
+
+    # 解析は別プロセスに投げたまま次の日付へ進み、最後にまとめて受け取る
+    parsed = []
+
+    browser.start()
+    budget = scheduler.current()
+    for d in dates:
+        if budget.stop():
+            break
+        url = f"https://www.jimin.jp/activity/?day={d.year}.{d.month}.{d.day}"
+        #dbg("[LDP] goto", url) <- デバックを見たければここを有効化
+        try:
+            with fetcher.guard(url):
+                html = browser.render(url, timeout_ms=budget.timeout_ms(25_000), user_agent=UA)
+        except fetcher.CircuitOpen:
+            budget.partial()       # 連続で落ちている間は残りの日付を諦める
+            break
+        except Exception:
+            continue
+        parsed.append((d, html, parsepool.submit(parse_day, html)))
+
+        time.sleep(WAIT_SEC)
+
+    # key=日付|タイトル で最良レコードを保持
+    best = {}
+    for d, html, fut in parsed:
+        try:
+            records = parsepool.result(fut, parse_day, html)
+        except Exception as e:
+            budget.partial()       # この日は取りこぼし（他の日は残す）
+            print(f"[WARN] ldp {d:%Y-%m-%d}: {e}", file=sys.stderr)
+            continue
+        for ttl, body in records:
+            # 行事は URL を持たないので (日付, タイトル) で識別
+            rec = Item("ldp", d, ttl, by_url=False, body=body)
+            if rec.key in best:
+                best[rec.key] = better(rec, best[rec.key])
+            else:
+                best[rec.key] = rec
+    return list(best.values())
+
+# ════════════════════════════════════════════════════════════════
+TITLE = "【自由民主党】"
+
+def collect(today=None):
+    return scrape_ldp(window_dates(jst_today(today)))
+
+# ───────── 過去分の取得（backfill.py から呼ばれる）
+BACKFILL_CHUNK_DAYS = 7     # 1 チャンク = 1 週間分の ?day= ページ
+BACKFILL_WORKERS    = 2     # 同時に進めるチャンク数（描画自体は browser.py が 1 枚ずつ行う）
+
+def backfill(start: datetime, end: datetime):
+    """start〜end（両端含む）の各日のページを古い順に巡回"""
+    return scrape_ldp([start + timedelta(days=i) for i in range((end - start).days + 1)])
+
+def render(ldp, today=None) -> str:
+    #print(f"\n===== {today.strftime('%-m月%-d日')} データ取得開始 =====\n")
+
+    out = [TITLE]
+    if ldp:
+        for r in ldp:
+            out.append(f"○{r.label()}　{r.title}")
+            if r.get('body') and r.get('body') != r.title:
+                out.append(f"　{r.get('body')}\n")
+            else:
+                out.append("")   # 本文が空またはタイトルと同じなら 1 行で
+    else:
+        out.append("DXやデジタル化に関連する新着情報および審議会等の開催はいずれもなし\n")
+    return "\n".join(out) + "\n"
+
+def main():
+    print(render(finish(collect())), end="")
+
+# ───────────────────────────────────────────
+if __name__ == "__main__":
+    main()
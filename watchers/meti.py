@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+meti_watcher.py  rev-1.0  (2026-10-19)
+
+■ 役割
+  経済産業省の「ニュースリリース」と「審議会・研究会」の新着一覧（静的 HTML）を
+  走査し、デジタル・情報政策関連キーワードを含み LOOKBACK〜AHEAD 期間に
+  該当するものを抽出して一覧表示する（ブラウザは使わない）。
+  ・日付は 記事 URL（/press/YYYY/MM/YYYYMMDDnnn/）→ 一覧の日付表記 の順で取り、
+    どちらも無いものだけ詳細ページを DETAIL_WORKERS 本までの並行で取得して判定
+  ・詳細ページの日付は項目ストアに保存し、次回からは取得しない
+  ・月初は前月のアーカイブ一覧も読む
+
+  IT_MONITOR_METI_FIXTURES にディレクトリを指定すると、ネットワークの代わりに
+  URL のパスに対応するファイル（例: <dir>/press/index.html）を読む（無ければ 404 の扱い）。
+  同梱の fixtures/meti で通信なしに動作を確認できる:
+      IT_MONITOR_METI_FIXTURES=watchers/fixtures/meti \
+          python IT_monitoring.py --sources meti --today 2025-06-10 --db /tmp/meti.db -o -
+  期待どおりの 4 件になるかは python bench/check_meti.py で確かめられる。
+"""
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin, urlsplit
+import jpdate
+from document import Matcher
+import parsepool
+import scheduler
+from item import Item
+from item_store import open_store
+from watchers import finish, jst_today
+# fetcher(requests) / bs4 は使う関数の中で読み込む
+
+# ───────── 基本設定
+UA = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+      "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125 Safari/537.36")
+JST   = timezone(timedelta(hours=9))
+
+LOOKBACK = 5      # 今日 + 過去4日
+AHEAD    = 7      # 未来 (開催案内など)
+DETAIL_WORKERS = 4    # 詳細ページの同時取得数
+BUDGET   = 120    # 秒（scheduler の持ち時間）
+POLL_SEC = 1800   # 秒（常駐モードの巡回間隔の初期値）
+
+BASE_URL    = "https://www.meti.go.jp"
+PRESS_URL   = f"{BASE_URL}/press/index.html"
+ARCHIVE_URL = f"{BASE_URL}/press/archive_{{:%Y%m}}.html"
+COUNCIL_URL = f"{BASE_URL}/shingikai/index.html"
+
+FIXTURES = os.environ.get("IT_MONITOR_METI_FIXTURES")
+
+# ───────── キーワード定義
+RAW_KW = [
+    # 技術・行政一般
+    "デジタル","情報通信","サイバー","AI","DX","ＤＸ","IT","SNS",
+    "標準仕様","ガイドライン","半導体","データセンター","クラウド","情報処理",
+    # 審議会関連
+    "商務流通情報分科会","情報経済小委員会","デジタル人材",
+]
+# NFKC + 小文字化して 1 本の正規表現で判定（2 文字の英字は単語境界つき）
+kw_hit = Matcher(RAW_KW)
+
+# ───────── 日付判定
+_URL_DATE = re.compile(r"/press/\d{4}/\d{2}/(\d{4})(\d{2})(\d{2})\d+/")
+
+def window(today: datetime):
+    """基準日 today に対する掲載期間の判定関数"""
+    win_from = today - timedelta(days=LOOKBACK - 1)
+    win_to   = today + timedelta(days=AHEAD)
+    return lambda d: win_from <= d <= win_to
+
+def url_date(url: str):
+    """ニュースリリースの URL に埋め込まれた発表日"""
+    if m := _URL_DATE.search(url):
+        try:
+            return datetime(*map(int, m.groups()), tzinfo=JST)
+        except ValueError:
+            return None
+    return None
+
+def listing_urls(today: datetime):
+    """読む一覧ページ（窓が前月にかかるときは前月のアーカイブも）"""
+    urls = [PRESS_URL, COUNCIL_URL]
+    win_from = today - timedelta(days=LOOKBACK - 1)
+    if win_from.month != today.month:
+        urls.insert(1, ARCHIVE_URL.format(win_from))
+    return urls
+
+# ───────── 取得
+def fetch(url: str):
+    """(本文バイト列, エンコーディング)。fixtures 指定時はファイルから読む"""
+    import requests
+    if FIXTURES:
+        path = os.path.join(FIXTURES, urlsplit(url).path.lstrip("/"))
+        if not os.path.isfile(path):
+            r = requests.Response()
+            r.status_code, r.url = 404, url
+        else:
+            with open(path, "rb") as f:
+                return f.read(), None
+    else:
+        import fetcher
+        r = fetcher.get(url, headers={"User-Agent": UA}, timeout=20, hedge=True)
+    r.raise_for_status()
+    return r.content, r.encoding
+
+def parse_listing(content: bytes, encoding: str, url: str):
+    """一覧からキーワードに合う記事を (タイトル, 絶対URL, 日付 or None) で返す
+    （parsepool の子プロセスで実行）"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(parsepool.decode(content, encoding), "html.parser")
+    out, seen = [], set()
+    for a in soup.select("a[href*='/press/'], a[href*='/shingikai/']"):
+        link = urljoin(url, a["href"]).split("#")[0]
+        title = a.get_text(" ", strip=True)
+        if (not title or link in seen or not link.endswith(".html")
+                or link.endswith("/index.html") or not kw_hit(title)):
+            continue
+        seen.add(link)
+        # 一覧の日付は <dt> やリンクを囲む行に書かれている
+        row = a.find_parent(["li", "dd", "tr", "p"]) or a.parent
+        near = row.get_text(" ", strip=True)
+        if row.name == "dd" and (dt := row.find_previous_sibling("dt")):
+            near = dt.get_text(" ", strip=True) + " " + near
+        out.append((title, link, url_date(link) or jpdate.find_date(near, ("ymd", "era"))))
+    return out
+
+def detail_date(url: str):
+    """詳細ページの掲載日（ストアに保存済みならそれを使う）"""
+    if cached := open_store().detail("meti", url):
+        return datetime.fromisoformat(cached["date"])
+    if scheduler.current().stop():
+        return None
+    import requests
+    try:
+        content, enc = fetch(url)
+    except requests.HTTPError as e:
+        # 消えた・見られない詳細ページは日付なしとして扱う（セクションは途中扱いにしない）
+        if e.response is not None and 400 <= e.response.status_code < 500:
+            return None
+        raise
+    dt = jpdate.find_date_html(parsepool.decode(content, enc), ("ymd", "era"))
+    if dt:
+        open_store().put_detail("meti", url, {"date": dt.isoformat()})
+    return dt
+
+# ───────── 経産省スクレイプ
+def scrape_meti(today: datetime):
+    import fetcher
+    in_window = window(today)
+    budget = scheduler.current()
+    found, seen = [], set()
+    for url in listing_urls(today):
+        if budget.stop():
+            break
+        try:
+            content, enc = fetch(url)
+        except fetcher.CircuitOpen:
+            budget.partial()      # ホスト遮断中は取得済みの分で打ち切り
+            break
+        except Exception as e:
+            budget.partial()      # この一覧は取りこぼし（他の一覧は読む）
+            print(f"[WARN] meti {url}: {e}", file=sys.stderr)
+            continue
+        for title, link, dt in parsepool.run_memo("meti", url, RAW_KW, parse_listing,
+                                                  content, enc, url):
+            if link not in seen:
+                seen.add(link)
+                found.append((title, link, dt))
+
+    # 日付の分からないものだけ詳細ページへ（同じホストなので同時数を絞る）
+    undated = [link for _, link, dt in found if dt is None]
+    dates = {}
+    if undated and not budget.stop():
+        with ThreadPoolExecutor(max_workers=DETAIL_WORKERS,
+                                thread_name_prefix="meti-detail") as ex:
+            futs = {link: ex.submit(scheduler.call, budget, detail_date, link)
+                    for link in undated}
+            for link, fut in futs.items():
+                try:
+                    dates[link] = fut.result()
+                except fetcher.CircuitOpen:
+                    budget.partial()
+                except Exception as e:
+                    budget.partial()
+                    print(f"[WARN] meti {link}: {e}", file=sys.stderr)
+
+    results = []
+    for title, link, dt in found:
+        dt = dt or dates.get(link)
+        if dt and in_window(dt):
+            results.append(Item("meti", dt, title, link))
+    return results
+
+# ───────── エントリポイント
+TITLE = "【経済産業省】"
+
+def collect(today=None):
+    return scrape_meti(jst_today(today))
+
+def render(results, today=None) -> str:
+    out = [TITLE]
+    if not results:
+        out.append("DXやデジタル化に関連する新着情報および審議会等の開催はいずれもなし\n")
+    for r in results:
+        out.append(f"○{r.label()}　{r.title}\n　{r.url}\n")
+    return "\n".join(out) + "\n"
+
+def main():
+    print(render(finish(collect())), end="")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+gov_dx_news_scraper.py  rev-2.1  (2025-06-17)
+
+■ 指定キーワードで Google News RSS を検索し、
+  省庁・自治体が関与する DX 関連ニュースのみ抽出。
+  4日より古い記事は除外します。
+"""
+
+# ───────── Imports ──────────────────────────────────────────
+import re, sys, time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote_plus
+import feeds
+from document import Matcher
+import scheduler
+from item import Item
+from watchers import finish, jst_today
+# requests は feeds.read() の中で読み込む
+
+# ───────── 検索キーワード ────────────────────────────────
+KEYWORDS = [
+    "DX","デジタル","クラウド","ガバメントクラウド","データセンター",
+    "経済安全保障","QUAD","サプライチェーン","セキュリティクリアランス",
+    "電気通信事業法","サイバーセキュリティ","Web3","半導体","AI",
+    "GIGAスクール構想","量子コンピューター","スーパーコンピュータ",
+    "スマホ新法","青少年インターネット環境整備法","Fintech",
+    "中央銀行デジタル通貨","知的財産","個人情報保護","医療DX",
+    "新年度予算 デジタル","スマホソフトウェア競争促進法","apple"
+    "アップル","グーグル","google","相互運用性"
+]
+
+# ───────── 行政主体フィルタ ────────────────────────────
+MINISTRIES = [
+    "総務省","経済産業省","デジタル庁","文部科学省","経産省","厚生労働省",
+    "農林水産省","国土交通省","財務省","金融庁","環境省","外務省","防衛省",
+    "内閣府","内閣官房","警察庁","消防庁","復興庁","公正取引委員会","公取委",
+    "国交省","厚労省","農水省","デジ庁","文科省","Google","アップル","apple",
+]
+PREF_SUFFIX = ("県","府","都","市","町","村")
+
+# ───────── 検索設定 ────────────────────────────────────
+UA = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+      "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125 Safari/537.36")
+JST  = timezone(timedelta(hours=9))
+SINCE_DAYS = 4  # ← ここを 4 日に変更
+BUDGET     = 120   # 秒（scheduler の持ち時間）
+POLL_SEC   = 1800  # 秒（常駐モードの巡回間隔の初期値）
+RSS_URL = "https://news.google.com/rss/search?hl=ja&gl=JP&ceid=JP:ja&q=" \
+          "{}%20when:4d"  # ← when:14d を when:4d に変更
+# 過去分の取得用（after: 以降 before: より前）
+RANGE_URL = "https://news.google.com/rss/search?hl=ja&gl=JP&ceid=JP:ja&q=" \
+            "{}%20after:{:%Y-%m-%d}%20before:{:%Y-%m-%d}"
+
+# ───────── ユーティリティ ──────────────────────────────
+_MINISTRY = Matcher(MINISTRIES)
+
+def is_gov_related(text:str)->bool:
+    if _MINISTRY.hit(text):
+        return True
+    if re.search(r"(政府|内閣|自治体|国が|国は)", text):
+        return True
+    for suf in PREF_SUFFIX:
+        if re.search(rf"[^\w]{{1,4}}{suf}", text):
+            return True
+    return False
+
+# ───────── RSS 取得 & 解析 ────────────────────────────
+def fetch_hits(keyword:str, since:datetime, until:datetime=None):
+    url = (RANGE_URL.format(quote_plus(keyword), since, until) if until
+           else RSS_URL.format(quote_plus(keyword)))
+    headers = {"User-Agent": UA}
+
+    # 検索結果は関連度順なので、古い項目に達しても途中で打ち切らない
+    for e in feeds.read(url, since, ordered=False, headers=headers, timeout=30):
+        if until and e.dt >= until:
+            continue
+        if not is_gov_related(e.title + e.summary):
+            continue
+        yield Item("news", e.dt, e.title, e.link)
+
+# ───────── メイン ──────────────────────────────────────
+TITLE = "【ニュース】"
+
+def search(since:datetime, until:datetime=None):
+    """全キーワードで since 以降（until より前）の記事を集める"""
+    import fetcher
+
+    news = []
+    budget = scheduler.current()
+    for kw in KEYWORDS:
+        if budget.stop():
+            break
+        try:
+            # キーワード間で重なった記事は finish() で URL により 1 件にまとまる
+            for hit in fetch_hits(kw, since, until):
+                news.append(hit)
+        except fetcher.CircuitOpen:
+            budget.partial()      # ホスト遮断中なら取得済みの分で打ち切り
+            break
+        except Exception as e:
+            budget.partial()      # このキーワードは取りこぼし
+            print(f"[WARN] {kw}: {e}", file=sys.stderr)
+        time.sleep(0.6)
+    return news
+
+def collect(today=None):
+    # 基準日指定時はその日の終わりから SINCE_DAYS 日さかのぼる
+    now = datetime.now(JST) if today is None else jst_today(today) + timedelta(days=1)
+    return search(now - timedelta(days=SINCE_DAYS))
+
+# ───────── 過去分の取得（backfill.py から呼ばれる）
+BACKFILL_CHUNK_DAYS = 7     # 検索結果は 1 回 100 件までなので週単位に刻む
+BACKFILL_WORKERS    = 1     # Google には並列で投げない
+
+def backfill(start:datetime, end:datetime):
+    return search(start, end + timedelta(days=1))
+
+def render(news, today=None) -> str:
+    out = [TITLE]
+    if not news:
+        out.append("該当記事なし")
+    for n in news:
+    # ・6月9日　タイトル
+        out.append(f"○{n.label()}　{n.title}")
+    # 　URL
+        out.append(f"　{n.url}\n")
+    return "\n".join(out) + "\n"
+
+def main():
+    print(render(finish(collect())), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+from datetime import datetime, timedelta
+from document import Document, Matcher
+import parsepool
+import scheduler
+from item import Item
+from item_store import open_store
+from watchers import finish, jst_today
+
+BASE_URL = 'https://www.nisc.go.jp'
+# 抽出対象とするキーワード
+KEYWORDS = [
+    "デジタル", "情報通信", "サイバー", "AI", "DX", "ＤＸ", "IT", "SNS",
+    "標準仕様", "ガイドライン", "無線局", "免許状", "光ファイバ"
+]
+MATCHER = Matcher(KEYWORDS)
+
+def parse_page(content: bytes, encoding: str):
+    """日付ページから (キーワード一致, タイトル, 公開日) を返す（parsepool の子プロセスで実行）"""
+    # テキスト化・正規化は Document が 1 回だけ行い、以下の判定で使い回す
+    doc = Document(content, encoding)
+
+    # キーワードフィルタ
+    if not doc.matches(MATCHER):
+        return False, None, None
+
+    # タイトル取得
+    title = doc.first('h2') or '[タイトル不明]'
+
+    # ページ内から公開日をパース（<time>・見出し付近 → 本文の順）
+    return True, title, doc.date(('ymd',), tz=None)
+
+def fetch_recent_nisc_news(days: int = 4, today=None):
+    import requests
+    import fetcher
+
+    today     = jst_today(today).replace(tzinfo=None)
+    threshold = today - timedelta(days=days)
+    results   = []
+
+    # —— デバッグ出力 ——
+    #print(f'DEBUG: today     = {today.strftime("%Y-%m-%d")}')
+    #print(f'DEBUG: threshold = {threshold.strftime("%Y-%m-%d")}')
+
+    # 閾値〜今日までの各日付ページをチェック
+    # 過去分の結果は解析のソース・キーワードの版とともに残し、版が変われば取り直す
+    version = parsepool.memo_version(parse_page, KEYWORDS)
+    budget = scheduler.current()
+    for delta in range((today - threshold).days + 1):
+        if budget.stop():
+            break
+        dt  = threshold + timedelta(days=delta)
+        url = f'{BASE_URL}/news/{dt.strftime("%Y%m%d")}.html'
+        #print(f'DEBUG: checking URL = {url}')
+
+        # 前日以前のページは内容が変わらないので、取得済みなら結果を再利用
+        if version and (cached := open_store().detail('nisc', url)) and cached.get('version') == version:
+            if cached['hit']:
+                results.append((datetime.fromisoformat(cached['date']), cached['title'], url))
+            continue
+
+        try:
+            resp = fetcher.get(url, timeout=20)
+        except fetcher.CircuitOpen:
+            budget.partial()      # ホスト遮断中なら取得済みの分で打ち切り
+            break
+        except requests.RequestException as e:
+            budget.partial()      # 取得済みの分を残して打ち切り
+            print(f'[WARN] nisc {url}: {e}', file=sys.stderr)
+            break
+        #print(f'DEBUG: raw status_code = {resp.status_code}')
+        if resp.status_code != 200:
+            continue
+
+        # 解析は別プロセスで行い、結果だけを受け取る
+        matched, title, dt_pub = parsepool.run_memo('nisc', url, KEYWORDS, parse_page,
+                                                     resp.content, resp.encoding)
+        #print(f'DEBUG: keyword match = {matched}')
+        if not matched:
+            if dt.date() < today.date():
+                open_store().put_detail('nisc', url, {'version': version, 'hit': False})
+            continue
+        #print(f'DEBUG: parsed dt_pub = {dt_pub}')
+        if not dt_pub:
+            # うまくパースできなければ URL 日付をそのまま使う
+            dt_pub = dt
+            #print(f'DEBUG: date parse failed, using URL date = {dt_pub.strftime("%Y-%m-%d")}')
+
+        if dt.date() < today.date():
+            open_store().put_detail('nisc', url, {'version': version, 'hit': True, 'date': dt_pub.isoformat(), 'title': title})
+        results.append((dt_pub, title, url))
+
+    #print(f'DEBUG: total matched results = {len(results)}\n')
+
+    return [Item('nisc', dt_pub, title, url) for dt_pub, title, url in results]
+
+
+TITLE = '【内閣サイバーセキュリティセンター・NISC】'
+DAYS  = 4
+BUDGET = 60     # 秒（scheduler の持ち時間）
+POLL_SEC = 3600 # 秒（常駐モードの巡回間隔の初期値。日付ページは 1 日 1 枚）
+
+def collect(today=None):
+    return fetch_recent_nisc_news(DAYS, today)
+
+# ───────── 過去分の取得（backfill.py から呼ばれる）
+BACKFILL_CHUNK_DAYS = 7     # 1 チャンク = 1 週間分の日付ページ
+BACKFILL_WORKERS    = 2
+
+def backfill(start, end):
+    """start〜end（両端含む）の日付ページを巡回"""
+    return fetch_recent_nisc_news((end - start).days, end)
+
+def render(results, today=None) -> str:
+    out = [TITLE]
+    if results:
+        for r in results:
+            out.append(f'○{r.label()}　「{r.title}」')
+            out.append(f'　{r.url}\n')
+    else:
+        today     = jst_today(today)
+        threshold = today - timedelta(days=DAYS)
+        out.append(f'{threshold.month}月{threshold.day}日〜{today.month}月{today.day}日　'
+                   'DXやデジタル化に関連する新着情報および審議会等の開催はいずれもなし\n')
+    return '\n'.join(out) + '\n'
+
+def main():
+    print(render(finish(collect())), end='')
+
+
+if __name__ == '__main__':
+    main()
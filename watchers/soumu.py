@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+soumu_watcher.py  rev‑4.6‑SOU  (2025‑06‑12)
+
+■ 役割
+  総務省サイト「What's New」インデックスを走査し、
+  デジタル・情報通信政策に関する告知のうち、LOOKBACK〜AHEAD 期間に
+  該当するものを抽出して一覧表示する。
+"""
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin
+import jpdate
+from document import Matcher
+import parsepool
+import scheduler
+from item import Item
+from item_store import open_store
+from watchers import finish, jst_today
+# requests / bs4 / playwright は使う関数の中で読み込む
+
+# ───────── 基本設定
+UA = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+      "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125 Safari/537.36")
+JST   = timezone(timedelta(hours=9))
+
+LOOKBACK = 5      # 今日 + 過去4日
+AHEAD    = 7      # 未来 (開催案内など)
+BUDGET   = 180    # 秒（scheduler の持ち時間）
+POLL_SEC = 3600   # 秒（常駐モードの巡回間隔の初期値）
+
+# ───────── キーワード定義
+RAW_KW = [
+    # 技術・行政一般
+    "デジタル","情報通信","サイバー","AI","DX","ＤＸ","IT","SNS",
+    "無線局","免許状","光ファイバ","標準仕様","ガイドライン",
+    # 審議会関連
+    "情報通信審議会","郵政政策部会","電気通信事業部会",
+    "技術分科会","陸上無線通信委員会","IPネットワーク設備委員会",
+]
+kw_hit = Matcher(RAW_KW)
+
+# ───────── 日付解析
+DATE_KINDS = ("era", "ymd", "slash")   # 和暦 → 西暦 → スラッシュ の優先順
+
+def parse_dt(text: str):
+    """タイトルから日付を抽出して datetime に変換"""
+    return jpdate.find_date(text, DATE_KINDS)
+
+def page_dt(html: str):
+    """詳細ページの見出し・<time> 付近から日付を抽出（無ければ本文全体）"""
+    return jpdate.find_date_html(html, DATE_KINDS)
+
+def window(today: datetime):
+    """基準日 today に対する掲載期間の判定関数"""
+    win_from = today - timedelta(days=LOOKBACK - 1)
+    win_to   = today + timedelta(days=AHEAD)
+    return lambda d: win_from <= d <= win_to
+
+# ───────── 低レベル fetch（エンコーディング自動判定）
+def fetch(url):
+    import fetcher
+    r = fetcher.get(url, headers={"User-Agent": UA}, timeout=25, hedge=True)
+    enc = r.apparent_encoding or "utf-8"
+    if enc.lower() == "utf-8" and b"\x82" in r.content[:300]:   # SJIS誤判定対策
+        enc = "shift_jis"
+    return r.content.decode(enc, "replace")
+
+# ───────── What's New インデックス候補抽出
+IDX_URL = "https://www.soumu.go.jp/menu_kyotsuu/whatsnew/index.html"
+
+def parse_index(html: str):
+    """What's New からキーワードに合うリンクを返す（parsepool の子プロセスで実行）"""
+    from bs4 import BeautifulSoup
+    links = []
+    for a in BeautifulSoup(html, "html.parser").find_all("a", href=True):
+        ttl = a.get_text(" ", strip=True)
+        if ttl and kw_hit(ttl):
+            links.append({"title": ttl, "url": urljoin(IDX_URL, a["href"])})
+    return links
+
+def list_candidates():
+    import browser
+    import fetcher
+
+    browser.start()
+    with fetcher.guard(IDX_URL):
+        html = browser.render(IDX_URL, timeout_ms=scheduler.current().timeout_ms(30000))
+    # 変わっていなければ前回の抽出結果を使う（描画後の HTML なので ETag は使えない）
+    return parsepool.run_memo("soumu", IDX_URL, RAW_KW, parse_index, html)
+
+# ───────── 総務省スクレイプ
+def scrape_soumu(today: datetime):
+    import fetcher
+    in_window = window(today)
+    results = []
+    budget = scheduler.current()
+    for rec in list_candidates():
+        if budget.stop():
+            break
+        dt = parse_dt(rec["title"])
+        if not dt and (cached := open_store().detail("soumu", rec["url"])):
+            dt = datetime.fromisoformat(cached["date"])
+        if not dt:
+            try:
+                html = fetch(rec["url"])
+            except fetcher.CircuitOpen:
+                budget.partial()       # ホスト遮断中は残りの詳細ページを諦める
+                break
+            except Exception:
+                continue
+            if dt := page_dt(html):
+                open_store().put_detail("soumu", rec["url"], {"date": dt.isoformat()})
+        if not dt or not in_window(dt):
+            continue
+        results.append(Item("soumu", dt, rec["title"], rec["url"]))
+    return results
+
+# ───────── エントリポイント
+TITLE = "【総務省】"
+
+def collect(today=None):
+    return scrape_soumu(jst_today(today))
+
+def render(results, today=None) -> str:
+    #print(f"===== 総務省 What's New Watch ({TODAY:%-m/%-d}) =====\n")
+    out = [TITLE]
+    if not results:
+        out.append("DXやデジタル化に関連する新着情報および審議会等の開催はいずれもなし")
+    for r in results:
+        out.append(f"○{r.label()}　{r.title}\n　{r.url}\n")
+    return "\n".join(out) + "\n"
+
+def main():
+    print(render(finish(collect())), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+speech_watcher.py  (2025-06-23 改訂版)
+
+デジタル庁「大臣等会見」ページから過去4日以内の会見を抽出し、
+各会見ページに埋め込まれた YouTube 動画のリンクと再生時間を取得して表示します。
+
+再生時間が取得できない場合はプレースホルダーを出力し、
+その下に該当の会見ページリンクも表示します。
+"""
+
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin
+
+import jpdate
+import parsepool
+import scheduler
+from item import Item
+from item_store import open_store
+from watchers import finish, jst_today
+
+# fetcher(requests) / bs4 は取得時に読み込む（--list-sources などで import コストを払わない）
+
+# ───────── 定数
+JST = timezone(timedelta(hours=9))
+LOOKBACK_DAYS = 4
+BUDGET = 90           # 秒（scheduler の持ち時間）
+POLL_SEC = 3600       # 秒（常駐モードの巡回間隔の初期値）
+
+BASE_URL = "https://www.digital.go.jp"
+LIST_URL = f"{BASE_URL}/speech"
+UA = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125 Safari/537.36"
+    )
+}
+
+def parse_iso8601_duration(duration: str) -> int:
+    m = re.match(r'PT(?:(?P<h>\d+)H)?(?:(?P<m>\d+)M)?(?:(?P<s>\d+)S)?', duration)
+    if not m:
+        return 0
+    h = int(m.group('h') or 0)
+    mi = int(m.group('m') or 0)
+    s = int(m.group('s') or 0)
+    return h * 3600 + mi * 60 + s
+
+# ───────── 解析（parsepool の子プロセスで実行）
+def parse_list(content: bytes, encoding: str):
+    """会見一覧から (リンク文字列, href) を返す"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, "html.parser", from_encoding=encoding)
+    return [(a.get_text(" ", strip=True), a["href"])
+            for a in soup.select("a[href^='/speech/minister']")]
+
+def parse_video_id(content: bytes, encoding: str):
+    """会見ページに埋め込まれた YouTube 動画の ID（無ければ None）"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, "html.parser", from_encoding=encoding)
+
+    iframe = soup.find("iframe", src=re.compile(r"youtube\.com/embed/"))
+    if iframe:
+        src = iframe["src"]
+        if src.startswith("//"):
+            src = "https:" + src
+        return src.rsplit("/", 1)[-1].split("?")[0]
+    a = soup.find("a", href=re.compile(r"(youtu\.be/|youtube\.com/watch)"))
+    if not a:
+        return None
+    href = a["href"]
+    if "youtu.be/" in href:
+        return href.split("youtu.be/")[1].split("?")[0]
+    return href.split("v=")[1].split("&")[0]
+
+def parse_duration(content: bytes, encoding: str):
+    """動画ページの <meta itemprop="duration"> の秒数（無ければ None）"""
+    from bs4 import BeautifulSoup
+    meta = BeautifulSoup(content, "html.parser", from_encoding=encoding).find("meta", itemprop="duration")
+    if not meta or not meta.get("content"):
+        return None
+    return parse_iso8601_duration(meta["content"])
+
+def fetch_speech_items(today: datetime):
+    import fetcher
+
+    window_start = today - timedelta(days=LOOKBACK_DAYS)
+    resp = fetcher.get(LIST_URL, headers=UA, timeout=10)
+    resp.raise_for_status()
+
+    items = []
+    for text, href in parsepool.run(parse_list, resp.content, resp.encoding):
+        dt = jpdate.find_date(text, ("era",))
+        if not dt:
+            continue
+        if not (window_start <= dt <= today):
+            continue
+
+        title = re.sub(r"（.*?）", "", text)
+        prefix = title[title.find("大臣"):] if "大臣" in title else title
+        url = urljoin(BASE_URL, href)
+        items.append(Item("speech", dt, prefix, url))
+    return items
+
+def lookup_youtube_in_speech(page_url: str):
+    import fetcher
+
+    # 再生時間まで取れた会見はストアから返す
+    if cached := open_store().detail("speech", page_url):
+        return cached["yt_url"], cached["length"]
+
+    resp = fetcher.get(page_url, headers=UA, timeout=10, hedge=True)
+    resp.raise_for_status()
+    vid = parsepool.run(parse_video_id, resp.content, resp.encoding)
+    if not vid:
+        return None, None
+
+    short_url = f"https://youtu.be/{vid}"
+    watch_url = f"https://www.youtube.com/watch?v={vid}"
+    r2 = fetcher.get(watch_url, headers=UA, timeout=10, hedge=True)
+    r2.raise_for_status()
+    total_sec = parsepool.run(parse_duration, r2.content, r2.encoding)
+    if total_sec is None:
+        return short_url, None
+    open_store().put_detail("speech", page_url, {"yt_url": short_url, "length": total_sec})
+    return short_url, total_sec
+
+def format_duration(sec: int) -> str:
+    m, s = divmod(sec or 0, 60)
+    return f"{m}分{s}秒"
+
+TITLE = "【平将明デジタル大臣】"
+
+def collect(today=None):
+    items = []
+    budget = scheduler.current()
+    for it in fetch_speech_items(jst_today(today)):
+        if budget.stop():
+            break
+        # 新着のみモードで出さない会見は動画を調べない
+        if not open_store().keep_item(it):
+            continue
+        yt_url, length = lookup_youtube_in_speech(it.url)
+        it.extra = {"yt_url": yt_url, "length": length}
+        items.append(it)
+        time.sleep(0.2)
+    return items
+
+def render(items, today=None) -> str:
+    if not items:
+        return "該当データなし\n"
+
+    out = [TITLE]
+    for it in items:
+        date_str = it.label()
+        prefix = it.title
+        page_url = it.url
+        yt_url, length = it.get("yt_url"), it.get("length")
+
+        if yt_url and length is not None:
+            out.append(f"○{date_str}の{prefix}（{format_duration(length)}）")
+            out.append(f"　{yt_url}")
+        elif yt_url:
+            out.append(f"○{date_str}の{prefix}（再生時間情報を自分で取得してください）")
+            out.append(f"　{yt_url}")
+            out.append(f"　（会見ページから自分で確認して！！！: {page_url}）\n")
+        else:
+            out.append(f"○{date_str}の{prefix}（！！！！再生時間情報を自分で取得してください！！！！！！）")
+            out.append(f"　（会見ページから自分で確認して！！！: {page_url}）\n")
+    return "\n".join(out) + "\n"
+
+def main():
+    print(render(finish(collect())), end="")
+
+if __name__ == "__main__":
+    main()